@@ -1,5 +1,4 @@
 import { useState } from "react";
-import axios from "axios";
 import { SentimentChart } from "./SentimentChart";
 import { EngagementChart } from "./EngagementChart";
 import { Input } from "../ui/input";
@@ -22,7 +21,16 @@ export function InputDemo() {
     if (error) setError(null);
   };
 
-  const handleSearch = async () => {
+  const applyResults = ({ sentiment_analysis, engagement_metrics }) => {
+    setTotalTweets(sentiment_analysis.total);
+    setPositivePercentage(sentiment_analysis.positive_percentage);
+    setNegativePercentage(sentiment_analysis.negative_percentage);
+    setNeutralPercentage(sentiment_analysis.neutral_percentage);
+    setEngagementMetrics(engagement_metrics);
+    setChartVisible(true);
+  };
+
+  const handleSearch = () => {
     if (!searchQuery.trim()) {
       setError("Please enter a search term");
       return;
@@ -34,32 +42,29 @@ export function InputDemo() {
 
     console.log("User Input:", searchQuery);
 
-    try {
-      const response = await axios.post("http://127.0.0.1:8081/api/variable", {
-        searchQuery: searchQuery.trim(),
-      });
-
-      const {
-        sentiment_analysis,
-        engagement_metrics
-      } = response.data;
-
-      // const randomOffset = Math.floor(Math.random() * (501 - 100)) ;
-      // const newTotal = Math.min(sentiment_analysis.total + randomOffset, 10000);
-
-      setEngagementMetrics(engagement_metrics);
-      setTotalTweets(sentiment_analysis.total);
-      setPositivePercentage(sentiment_analysis.positive_percentage);
-      setNegativePercentage(sentiment_analysis.negative_percentage);
-      setNeutralPercentage(sentiment_analysis.neutral_percentage);
-      setEngagementMetrics(engagement_metrics);
-      setChartVisible(true);
-    } catch (error) {
-      console.error("Error during search:", error);
+    // Charts update after every scored page instead of waiting for the full result
+    const params = new URLSearchParams({ searchQuery: searchQuery.trim() });
+    const source = new EventSource(`http://127.0.0.1:8081/api/variable/stream?${params}`);
+
+    const fail = (event) => {
+      console.error("Error during search:", event);
       setError("An error occurred while analyzing tweets. Please try again.");
-    } finally {
       setLoading(false);
-    }
+      source.close();
+    };
+
+    source.addEventListener("partial", (event) => {
+      applyResults(JSON.parse(event.data));
+    });
+
+    source.addEventListener("result", (event) => {
+      applyResults(JSON.parse(event.data));
+      setLoading(false);
+      source.close();
+    });
+
+    source.addEventListener("failed", fail);
+    source.onerror = fail;
   };
 
   const handleKeyPress = (event) => {
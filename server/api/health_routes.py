@@ -0,0 +1,25 @@
+# server/api/health_routes.py
+from flask import Blueprint, jsonify
+from services.model_registry import model_registry
+from api.search_routes import sentiment_analyzer
+
+def register_health_routes(app):
+    health_bp = Blueprint('health', __name__)
+
+    @health_bp.route("/api/health", methods=['GET'])
+    def health():
+        """Liveness: the process is up and serving requests"""
+        scheduler = sentiment_analyzer.scheduler
+        return jsonify({
+            "status": "ok",
+            "model": model_registry.status(),
+            "scheduler": scheduler.stats() if scheduler is not None else None
+        })
+
+    @health_bp.route("/api/health/ready", methods=['GET'])
+    def ready():
+        """Readiness: 200 once the sentiment model is loaded and warmed up, 503 before"""
+        status = model_registry.status()
+        return jsonify(status), (200 if status["ready"] else 503)
+
+    app.register_blueprint(health_bp)
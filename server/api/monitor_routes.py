@@ -0,0 +1,93 @@
+# server/api/monitor_routes.py
+from flask import Blueprint, jsonify, request
+import logging
+from api.search_routes import run_search_pipeline, twitter_service
+from services.topic_monitor import TopicMonitor, SeriesStore
+from config.config import MonitorConfig
+from config.constants import COUNTRIES_WOEID
+
+logger = logging.getLogger(__name__)
+
+# Initialize services
+monitor_config = MonitorConfig()
+series_store = SeriesStore(capacity=monitor_config.SERIES_CAPACITY)
+topic_monitor = TopicMonitor(
+    # Only tweets newer than the previous monitor run are processed, so each point covers one
+    # interval; the monitor keeps its own watermarks so interactive searches don't advance them
+    run_query=lambda query: run_search_pipeline(query, since_watermark=True, watermark_scope="monitor"),
+    fetch_trends=twitter_service.fetch_trends,
+    series_store=series_store,
+    query_interval=monitor_config.QUERY_INTERVAL,
+    trends_interval=monitor_config.TRENDS_INTERVAL,
+    top_trends=monitor_config.TOP_TRENDS_PER_REGION,
+    max_workers=monitor_config.MAX_WORKERS
+)
+for monitored_query in monitor_config.QUERIES:
+    topic_monitor.add_query(monitored_query)
+for monitored_country in monitor_config.REGIONS:
+    if monitored_country in COUNTRIES_WOEID:
+        topic_monitor.add_region(monitored_country, COUNTRIES_WOEID[monitored_country])
+    else:
+        logger.warning(f"Unknown monitored region: {monitored_country}")
+
+def register_monitor_routes(app):
+    monitor_bp = Blueprint('monitor', __name__)
+
+    if monitor_config.ENABLED:
+        topic_monitor.start()
+
+    @monitor_bp.route("/api/monitor", methods=['GET'])
+    def monitor_status():
+        """Endpoint listing monitored queries and regions with their last run"""
+        return jsonify({**topic_monitor.status(), "topics": series_store.topics()})
+
+    @monitor_bp.route("/api/monitor/series", methods=['GET'])
+    def monitor_series():
+        """Endpoint returning the precomputed rolling time series for a topic"""
+        topic = request.args.get("topic", "").strip()
+        if not topic:
+            return jsonify({"message": "No topic provided."}), 400
+        series = series_store.get(topic)
+        if series is None:
+            return jsonify({"message": "No series recorded for this topic yet"}), 404
+        return jsonify({"topic": topic, "series": series})
+
+    @monitor_bp.route("/api/monitor/queries", methods=['POST'])
+    def add_monitored_query():
+        """Endpoint to start monitoring a query"""
+        query = (request.json.get("query") or "").strip()
+        if not query:
+            return jsonify({"message": "No query provided."}), 400
+        try:
+            topic_monitor.add_query(query, request.json.get("interval"))
+        except ValueError as e:
+            return jsonify({"message": str(e)}), 400
+        return jsonify(topic_monitor.status()), 201
+
+    @monitor_bp.route("/api/monitor/queries/<path:query>", methods=['DELETE'])
+    def remove_monitored_query(query):
+        """Endpoint to stop monitoring a query"""
+        if not topic_monitor.remove_query(query):
+            return jsonify({"message": "Query is not monitored"}), 404
+        return jsonify(topic_monitor.status())
+
+    @monitor_bp.route("/api/monitor/regions", methods=['POST'])
+    def add_monitored_region():
+        """Endpoint to start monitoring the top trends of a country"""
+        country = (request.json.get("country") or "").strip()
+        if country not in COUNTRIES_WOEID:
+            return jsonify({"message": "Unknown country."}), 400
+        try:
+            topic_monitor.add_region(country, COUNTRIES_WOEID[country], request.json.get("interval"))
+        except ValueError as e:
+            return jsonify({"message": str(e)}), 400
+        return jsonify(topic_monitor.status()), 201
+
+    @monitor_bp.route("/api/monitor/regions/<country>", methods=['DELETE'])
+    def remove_monitored_region(country):
+        """Endpoint to stop monitoring a country's trends"""
+        if not topic_monitor.remove_region(country):
+            return jsonify({"message": "Region is not monitored"}), 404
+        return jsonify(topic_monitor.status())
+
+    app.register_blueprint(monitor_bp)
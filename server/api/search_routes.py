@@ -1,13 +1,20 @@
 # server/api/search_routes.py
-from flask import jsonify, request, Blueprint
+from flask import jsonify, request, Blueprint, Response, stream_with_context
 from services.twitter_service import TwitterService
 from services.data_service import DataCleaner
-from services.analytics_service import SentimentAnalyzer, EngagementAnalyzer
-from config.config import TwitterConfig
+from services.analytics_service import SentimentAnalyzer, EngagementAnalyzer, RunningSentimentStats
+from services.sentiment_cache import SentimentCache
+from services.job_service import Job, JobManager
+from services.tweet_archive import TweetArchive
+from services.watermark_store import WatermarkStore
+from services.coalescing_cache import CoalescingCache
+from config.config import TwitterConfig, SentimentConfig, InferenceServerConfig, JobConfig, SearchConfig
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
 import json
 import os
-import datetime
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
@@ -15,69 +22,71 @@ logger = logging.getLogger(__name__)
 twitter_config = TwitterConfig()
 twitter_service = TwitterService(twitter_config)
 data_cleaner = DataCleaner()
+sentiment_config = SentimentConfig()
+inference_server_config = InferenceServerConfig()
+# Scores from different backends and precisions are cached and archived separately; with the
+# remote backend that is whatever the inference server runs, checked on connect
+if sentiment_config.BACKEND == 'remote':
+    inference_variant = f"{inference_server_config.BACKEND}-{inference_server_config.PRECISION}"
+else:
+    inference_variant = f"{sentiment_config.BACKEND}-{sentiment_config.PRECISION}"
+sentiment_cache = SentimentCache(
+    db_path=sentiment_config.CACHE_PATH,
+    model_name=sentiment_config.MODEL_NAME,
+    model_path=sentiment_config.MODEL_PATH,
+    max_entries=sentiment_config.CACHE_MAX_ENTRIES,
+    variant=inference_variant,
+    bundle_path=sentiment_config.BUNDLE_PATH
+) if sentiment_config.CACHE_ENABLED else None
+model_identity = sentiment_cache.model_identity if sentiment_cache is not None else SentimentCache.model_identity_for(
+    sentiment_config.MODEL_NAME, sentiment_config.MODEL_PATH, inference_variant, sentiment_config.BUNDLE_PATH
+)
 sentiment_analyzer = SentimentAnalyzer(
-    model_path='model/sentiment_analysis_model.pt',
-    model_name="cardiffnlp/twitter-xlm-roberta-base-sentiment"
+    model_path=sentiment_config.MODEL_PATH,
+    model_name=sentiment_config.MODEL_NAME,
+    batch_size=sentiment_config.BATCH_SIZE,
+    max_length=sentiment_config.MAX_LENGTH,
+    cache=sentiment_cache,
+    precision=sentiment_config.PRECISION,
+    backend=sentiment_config.BACKEND,
+    onnx_path=sentiment_config.ONNX_PATH,
+    intra_op_threads=sentiment_config.INTRA_OP_THREADS,
+    inter_op_threads=sentiment_config.INTER_OP_THREADS,
+    server_address=inference_server_config.ADDRESS,
+    server_authkey=inference_server_config.AUTHKEY.encode('utf-8'),
+    server_variant=inference_variant if sentiment_config.BACKEND == 'remote' else None,
+    bundle_path=sentiment_config.BUNDLE_PATH
 )
+if sentiment_config.SCHEDULER_ENABLED:
+    sentiment_analyzer.use_scheduler(sentiment_config.SCHEDULER_MAX_BATCH, sentiment_config.SCHEDULER_MAX_WAIT_MS)
 engagement_analyzer = EngagementAnalyzer(sentiment_analyzer)
+job_config = JobConfig()
+job_manager = JobManager(max_workers=job_config.MAX_WORKERS, result_ttl=job_config.RESULT_TTL)
+search_config = SearchConfig()
+fetch_executor = ThreadPoolExecutor(max_workers=search_config.FETCH_WORKERS, thread_name_prefix="fetch")
+tweet_archive = TweetArchive(search_config.ARCHIVE_PATH, model_identity=model_identity)
+watermark_store = WatermarkStore(search_config.WATERMARK_PATH)
+# Identical concurrent searches share one pipeline run; results are reused briefly afterwards
+search_results = CoalescingCache(
+    ttl=search_config.RESULT_TTL,
+    max_entries=search_config.RESULT_CACHE_MAX_ENTRIES,
+    name="search"
+)
+# Streamed searches in flight by search key, so concurrent streams follow one background run
+stream_runs = {}
+stream_runs_lock = threading.Lock()
 
 # Create directory for storing tweet data files if it doesn't exist
 os.makedirs('server/data', exist_ok=True)
 # Create directory for storing translations
 os.makedirs('server/data/translations', exist_ok=True)
 
-def save_tweets_with_sentiment(df, search_query):
-    """Save the tweets with their sentiment analysis to a JSON file"""
-    # Get the columns that are available in the DataFrame
-    available_columns = df.columns.tolist()
-    
-    # Define the columns we want to save, if they exist
-    desired_columns = ['id', 'text', 'cleaned_text', 'favorite_count', 
-                       'retweet_count', 'reply_count', 'sentiment', 'sentiment_score',
-                       'original_lang']  # Added original_lang
-    
-    # Filter to only include columns that exist in the DataFrame
-    columns_to_save = [col for col in desired_columns if col in available_columns]
-    
-    # Create a subset of the dataframe with only the columns we want to keep
-    tweet_data = df[columns_to_save].copy()
-    
-    # Convert to dictionary records
-    tweet_records = tweet_data.to_dict(orient='records')
-    
-    # Create metadata
-    timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    metadata = {
-        "search_query": search_query,
-        "timestamp": timestamp,
-        "total_tweets": len(tweet_records)
-    }
-    
-    # Calculate language statistics
+def save_tweets_with_sentiment(df, search_query, watermark_scope=None):
+    """Archive the tweets with their sentiment analysis and return the search ID"""
     lang_stats = calculate_language_stats(df)
-    metadata["language_stats"] = lang_stats["languages"]
-    
-    # Create the final data structure
-    data_to_save = {
-        "metadata": metadata,
-        "tweets": tweet_records
-    }
-    
-    # Save to file with query name and timestamp
-    sanitized_query = search_query.replace(" ", "_").replace("/", "_").replace("\\", "_")[:30]
-    filename = f"data/tweets_{sanitized_query}_{timestamp}.json"
-    
-    # Ensure the directory exists
-    os.makedirs(os.path.dirname(filename), exist_ok=True)
-    
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(data_to_save, f, ensure_ascii=False, indent=2)
-    
-    # Always update a "latest.json" file to have the most recent search results
-    with open("data/latest_tweets.json", 'w', encoding='utf-8') as f:
-        json.dump(data_to_save, f, ensure_ascii=False, indent=2)
-    
-    return filename
+    search_id = tweet_archive.save_search(df, search_query, lang_stats["languages"])
+    watermark_store.update(search_query, df, watermark_scope)
+    return search_id
 
 def calculate_language_stats(df):
     """Calculate statistics about languages in the dataset"""
@@ -121,6 +130,272 @@ def prepare_tweet_data(df):
         
     return tweet_list
 
+def parse_flag(value, default=False):
+    """Boolean request parameter that may arrive as a bool, number or string such as "false" """
+    if value is None:
+        return default
+    if isinstance(value, str):
+        return value.strip().lower() not in ("", "0", "false", "no", "off")
+    return bool(value)
+
+def split_archived(df, incremental=True):
+    """
+    Separate tweets already in the archive (returned with their stored cleaning
+    and sentiment) from new ones that still need the full pipeline.
+    """
+    if not incremental:
+        return df.iloc[0:0], df
+    known, new = tweet_archive.split_known(df)
+    if len(known):
+        logger.debug(f"Reusing {len(known)} archived tweets, {len(new)} new")
+    return known, new
+
+def iter_scored_pages(user_input, translation_data=None, incremental=True, since_id=None):
+    """
+    Yield each page of tweets cleaned and scored, overlapping processing with fetching.
+
+    Args:
+        user_input (str): Search query
+        translation_data (list, optional): Collects translation records from every page
+        incremental (bool): Reuse stored cleaning and scores for already archived tweet IDs
+        since_id (int, optional): Only fetch tweets newer than this watermark
+
+    Yields:
+        pd.DataFrame: One cleaned and scored page
+    """
+    for page_df in twitter_service.iter_tweet_frames(user_input, since_id=since_id):
+        known, new = split_archived(page_df, incremental)
+        if len(new):
+            new, page_translations = data_cleaner.clean_page(new)
+            if translation_data is not None:
+                translation_data.extend(page_translations)
+            if len(new):
+                new = sentiment_analyzer.score_dataframe(new)
+        page_df = pd.concat([known, new]) if len(known) else new
+        if page_df.empty:
+            continue
+        yield page_df
+
+def iter_search_pipeline(user_input, incremental=True, since_watermark=False, watermark_scope=None):
+    """
+    Run the search pipeline for a query, yielding partial results along the way.
+
+    With since_watermark, paging stops at the newest tweet seen by earlier runs
+    of the same query and only the newer tweets are processed. Runs only read
+    and advance the watermark of their own watermark_scope.
+
+    Yields:
+        tuple: ("page", running aggregates) after each scored page,
+               ("saving", None) before results are persisted and
+               ("result", /api/variable response payload) once at the end
+    """
+    # Fetch pages as they arrive; clean and score each page while the next one is fetched
+    stats = RunningSentimentStats(engagement_analyzer.metrics, engagement_analyzer.metric_names)
+    since_id = watermark_store.get_since_id(user_input, watermark_scope) if since_watermark else None
+    pages = []
+    translation_data = []
+    for page_df in iter_scored_pages(user_input, translation_data, incremental, since_id):
+        pages.append(page_df)
+        stats.update(page_df)
+        yield "page", {**stats.snapshot(), "pages": len(pages)}
+
+    if not pages:
+        if since_id is None:
+            raise Exception("No tweets found in the response")
+        # Nothing new since the watermark
+        yield "result", {
+            **stats.snapshot(),
+            "tweets_data": {"search_id": None, "count": 0, "search_query": user_input},
+            "watermark": watermark_store.get(user_input, watermark_scope)
+        }
+        return
+    df = pd.concat(pages, ignore_index=True)
+
+    # Save translations and tweets with sentiment to file
+    yield "saving", None
+    if translation_data:
+        data_cleaner.translator.save_translations(translation_data, user_input)
+    search_id = save_tweets_with_sentiment(df, user_input, watermark_scope)
+    
+    # The running aggregates already cover every page
+    analysis_results = stats.snapshot()
+    result = {
+        "sentiment_analysis": analysis_results.get('sentiment_analysis', {}),
+        "engagement_metrics": analysis_results.get('engagement_metrics', {}),
+        "tweets_data": {
+            "search_id": search_id,
+            "count": len(df),
+            "search_query": user_input
+        }
+    }
+    if since_watermark:
+        result["watermark"] = watermark_store.get(user_input, watermark_scope)
+    yield "result", result
+
+def search_key(user_input, incremental=True):
+    """Cache key for a search: the normalised query plus options that change the result"""
+    return (WatermarkStore.normalize_query(user_input), bool(incremental))
+
+def run_search_pipeline(user_input, job=None, incremental=True, since_watermark=False, watermark_scope=None):
+    """
+    Run fetch -> clean/translate -> sentiment -> engagement -> save for a query.
+
+    Concurrent calls for the same normalised query attach to one in-flight run,
+    and its result is served to repeats for SearchConfig.RESULT_TTL seconds.
+
+    Args:
+        user_input (str): Search query
+        job (Job, optional): Background job to report stage progress to
+        incremental (bool): Reuse stored cleaning and scores for already archived tweet IDs
+        since_watermark (bool): Only fetch and process tweets newer than the query's watermark
+        watermark_scope (str, optional): Watermark namespace read and advanced by this run
+
+    Returns:
+        dict: The /api/variable response payload
+    """
+    def report(stage, **progress):
+        if job is not None:
+            job.update(stage, **progress)
+
+    def run():
+        report("fetching")
+        result = None
+        for kind, payload in iter_search_pipeline(user_input, incremental, since_watermark, watermark_scope):
+            if kind == "page":
+                scored = payload["sentiment_analysis"]["total"]
+                report("scoring", pages=payload["pages"], fetched=scored, scored=scored)
+                if job is not None:
+                    job.publish("partial", snapshot=payload)
+            elif kind == "saving":
+                report("saving")
+            else:
+                result = payload
+        return result
+
+    # Watermark runs return only the delta since the previous run, so they are never shared
+    if since_watermark:
+        return run()
+    return search_results.get(search_key(user_input, incremental), run)
+
+def start_stream_run(user_input, incremental=True):
+    """
+    Return the background job running a streamed search, starting one if none is in flight.
+
+    The run is not tied to any connection: every stream for the same search
+    subscribes to the job's event log (replayed from the start for late
+    subscribers), and a client disconnecting only ends its own subscription.
+    """
+    key = search_key(user_input, incremental)
+
+    def run(job):
+        try:
+            return run_search_pipeline(user_input, job, incremental)
+        finally:
+            with stream_runs_lock:
+                if stream_runs.get(key) is job:
+                    del stream_runs[key]
+
+    with stream_runs_lock:
+        job = stream_runs.get(key)
+        if job is None:
+            job = stream_runs[key] = job_manager.submit(
+                "search", run, params={"searchQuery": user_input, "incremental": incremental}
+            )
+    return job
+
+def run_multi_search_pipeline(queries, job=None, incremental=True):
+    """
+    Run the search pipeline for several queries at once.
+
+    Queries are fetched and cleaned concurrently, then all cleaned texts are
+    scored together in shared model batches before being split back per query.
+
+    Args:
+        queries (list): Search queries
+        job (Job, optional): Background job to report stage progress to
+        incremental (bool): Reuse stored cleaning and scores for already archived tweet IDs
+
+    Returns:
+        dict: Per-query sentiment and engagement breakdowns
+    """
+    def report(stage, **progress):
+        if job is not None:
+            job.update(stage, **progress)
+
+    def fetch_and_clean(query):
+        df = twitter_service.fetch_tweets(query)
+        known, new = split_archived(df, incremental)
+        if len(new):
+            new = data_cleaner.clean_dataframe(new, query)
+        return known, new
+
+    report("fetching", queries=len(queries))
+    futures = {query: fetch_executor.submit(fetch_and_clean, query) for query in queries}
+
+    frames = {}
+    known_frames = {}
+    errors = {}
+    for query, future in futures.items():
+        try:
+            known_frames[query], frames[query] = future.result()
+        except Exception as e:
+            logger.error(f"Error fetching query '{query}': {str(e)}")
+            errors[query] = str(e)
+        report("fetched", completed=len(frames) + len(errors),
+               fetched=sum(len(frames[q]) + len(known_frames[q]) for q in frames))
+
+    # Score every query's new tweets in one shared set of batches
+    scored_queries = list(frames.keys())
+    total = sum(len(df) for df in frames.values())
+    report("scoring", scored=0, total=total)
+    sentiment_analyzer.score_dataframes(
+        [frames[query] for query in scored_queries if len(frames[query])],
+        progress_callback=lambda scored, total: report("scoring", scored=scored, total=total)
+    )
+
+    # Put reused archived tweets back alongside the newly scored ones
+    for query in scored_queries:
+        if len(known_frames[query]):
+            frames[query] = pd.concat([known_frames[query], frames[query]], ignore_index=True)
+
+    report("saving")
+    results = []
+    for query in queries:
+        if query in errors:
+            results.append({
+                "search_query": query,
+                "error": errors[query],
+                "message": "Failed to fetch or process Twitter data"
+            })
+            continue
+
+        df = frames[query]
+        if df.empty:
+            results.append({
+                "search_query": query,
+                "error": "No tweets found in the response",
+                "message": "Failed to fetch or process Twitter data"
+            })
+            continue
+        analysis_results = engagement_analyzer.summarize(df)
+        search_id = save_tweets_with_sentiment(df, query)
+        results.append({
+            "search_query": query,
+            "sentiment_analysis": analysis_results.get('sentiment_analysis', {}),
+            "engagement_metrics": analysis_results.get('engagement_metrics', {}),
+            "tweets_data": {
+                "search_id": search_id,
+                "count": len(df),
+                "search_query": query
+            }
+        })
+
+    return {
+        "total_queries": len(queries),
+        "failed_queries": len(errors),
+        "results": results
+    }
+
 def register_search_routes(app):
     search_bp = Blueprint('search', __name__)
 
@@ -129,35 +404,25 @@ def register_search_routes(app):
         user_input = request.json.get("searchQuery", "")
         if not user_input:
             return jsonify({"message": "No search query provided."}), 400
+        incremental = parse_flag(request.json.get("incremental"), search_config.INCREMENTAL)
+        since_watermark = parse_flag(request.json.get("sinceWatermark"), False)
+
+        # Job mode: return immediately and run the pipeline in the background
+        if parse_flag(request.json.get("async")) or request.args.get("mode") == "job":
+            job = job_manager.submit(
+                "search",
+                lambda job: run_search_pipeline(user_input, job, incremental, since_watermark),
+                params={"searchQuery": user_input}
+            )
+            return jsonify({
+                "job_id": job.id,
+                "status": job.status,
+                "status_url": f"/api/jobs/{job.id}",
+                "events_url": f"/api/jobs/{job.id}/events"
+            }), 202
+
         try:
-            # Fetch and process data
-            df = twitter_service.fetch_tweets(user_input)
-            
-            # Clean data and detect languages
-            df = data_cleaner.clean_dataframe(df, user_input)
-            
-            # Get integrated analysis
-            analysis_results = engagement_analyzer.analyze(df)
-            
-            # Calculate language statistics
-            lang_stats = calculate_language_stats(df)
-            
-            # Prepare tweet data for frontend
-            tweet_data = prepare_tweet_data(df)
-            
-            # Save tweets with sentiment to file
-            filename = save_tweets_with_sentiment(df, user_input)
-            
-            # Add file information to the response
-            response = {
-                "sentiment_analysis": analysis_results.get('sentiment_analysis', {}),
-                "engagement_metrics": analysis_results.get('engagement_metrics', {}),
-                "tweets_data": {
-                    "filename": os.path.basename(filename),
-                    "count": len(df),
-                    "search_query": user_input
-                }
-            }
+            response = run_search_pipeline(user_input, incremental=incremental, since_watermark=since_watermark)
             
             # Debug print final response
             print("Final API Response:", response)
@@ -169,16 +434,110 @@ def register_search_routes(app):
                 "error": str(e),
                 "message": "Failed to fetch or process Twitter data"
             }), 500
+
+    @search_bp.route("/api/variable/stream", methods=['GET'])
+    def variable_stream():
+        """
+        Endpoint streaming running sentiment and engagement aggregates as Server-Sent Events.
+
+        Emits a "partial" event after each scored page and a final "result"
+        event carrying the same payload as /api/variable.
+        """
+        user_input = request.args.get("searchQuery", "").strip()
+        if not user_input:
+            return jsonify({"message": "No search query provided."}), 400
+        incremental = parse_flag(request.args.get("incremental"), search_config.INCREMENTAL)
+
+        def generate():
+            # The search runs on the job executor and shares the single-flight layer with
+            # /api/variable and jobs; this generator only follows its event log
+            job = start_stream_run(user_input, incremental)
+            for event in job.iter_events():
+                if event is None:
+                    yield ": keep-alive\n\n"
+                elif event["type"] == "partial":
+                    yield f"event: partial\ndata: {json.dumps(event['snapshot'])}\n\n"
+
+            if job.status == Job.COMPLETED:
+                yield f"event: result\ndata: {json.dumps(job.result)}\n\n"
+            else:
+                error = {"error": job.error, "message": "Failed to fetch or process Twitter data"}
+                yield f"event: failed\ndata: {json.dumps(error)}\n\n"
+
+        return Response(stream_with_context(generate()), mimetype='text/event-stream',
+                        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+    @search_bp.route("/api/variable/multi", methods=['POST'])
+    def variable_multi():
+        """Endpoint to analyze several search queries in one request"""
+        queries = request.json.get("searchQueries", [])
+        if not isinstance(queries, list):
+            return jsonify({"message": "searchQueries must be a list."}), 400
+
+        # Drop blanks and duplicates while keeping order
+        queries = list(dict.fromkeys(q.strip() for q in queries if isinstance(q, str) and q.strip()))
+        if not queries:
+            return jsonify({"message": "No search queries provided."}), 400
+        if len(queries) > search_config.MAX_QUERIES:
+            return jsonify({"message": f"At most {search_config.MAX_QUERIES} queries are allowed."}), 400
+        incremental = parse_flag(request.json.get("incremental"), search_config.INCREMENTAL)
+
+        if parse_flag(request.json.get("async")) or request.args.get("mode") == "job":
+            job = job_manager.submit(
+                "multi_search",
+                lambda job: run_multi_search_pipeline(queries, job, incremental),
+                params={"searchQueries": queries}
+            )
+            return jsonify({
+                "job_id": job.id,
+                "status": job.status,
+                "status_url": f"/api/jobs/{job.id}",
+                "events_url": f"/api/jobs/{job.id}/events"
+            }), 202
+
+        try:
+            return jsonify(run_multi_search_pipeline(queries, incremental=incremental))
+        except Exception as e:
+            logger.error(f"Error occurred: {str(e)}")
+            return jsonify({
+                "error": str(e),
+                "message": "Failed to fetch or process Twitter data"
+            }), 500
+
+    @search_bp.route("/api/jobs/<job_id>", methods=['GET'])
+    def get_job(job_id):
+        """Endpoint to poll the status (and result, once finished) of a background job"""
+        job = job_manager.get(job_id)
+        if job is None:
+            return jsonify({"message": "Job not found"}), 404
+        return jsonify(job.to_dict())
+
+    @search_bp.route("/api/jobs/<job_id>/events", methods=['GET'])
+    def stream_job_events(job_id):
+        """Endpoint streaming job stage progress as Server-Sent Events"""
+        job = job_manager.get(job_id)
+        if job is None:
+            return jsonify({"message": "Job not found"}), 404
+
+        def generate():
+            for event in job.iter_events():
+                if event is None:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield f"data: {json.dumps(event)}\n\n"
+            yield f"event: done\ndata: {json.dumps(job.to_dict())}\n\n"
+
+        return Response(stream_with_context(generate()), mimetype='text/event-stream',
+                        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
     
     @search_bp.route("/api/tweets", methods=['GET'])
     def get_latest_tweets():
-        """Endpoint to retrieve the latest saved tweets"""
+        """Endpoint to retrieve the latest saved tweets (or a given search via ?searchId=)"""
         try:
-            with open("server/data/latest_tweets.json", 'r', encoding='utf-8') as f:
-                tweet_data = json.load(f)
+            tweet_data = tweet_archive.get_search(request.args.get("searchId", type=int))
+            if tweet_data is None:
+                return jsonify({"message": "No tweet data available yet"}), 404
             return jsonify(tweet_data)
-        except FileNotFoundError:
-            return jsonify({"message": "No tweet data available yet"}), 404
         except Exception as e:
             logger.error(f"Error retrieving tweet data: {str(e)}")
             print(f"Error retrieving tweet data: {str(e)}")
@@ -186,42 +545,39 @@ def register_search_routes(app):
                 "error": str(e),
                 "message": "Failed to retrieve tweet data"
             }), 500
-    
-    # New endpoint for retrieving translations
-    @search_bp.route("/api/translations/<tweet_id>", methods=['GET'])
-    def get_translation(tweet_id):
-        """Endpoint to retrieve a translation for a specific tweet"""
+
+    @search_bp.route("/api/archive/tweets", methods=['GET'])
+    def query_archived_tweets():
+        """
+        Endpoint to read archived tweets filtered by query, time range and sentiment.
+
+        Query params: searchQuery, since/until (epoch seconds), sentiment, limit, offset
+        """
+        sentiment = request.args.get("sentiment")
+        if sentiment is not None and sentiment not in ('positive', 'neutral', 'negative'):
+            return jsonify({"message": "sentiment must be positive, neutral or negative."}), 400
         try:
-            translation_file = f"server/data/translations/{tweet_id}.json"
-            if not os.path.exists(translation_file):
-                return jsonify({"message": "Translation not available"}), 404
-                
-            with open(translation_file, 'r', encoding='utf-8') as f:
-                translation_data = json.load(f)
-            return jsonify(translation_data)
-        except Exception as e:
-            logger.error(f"Error retrieving translation: {str(e)}")
+            limit = min(max(request.args.get("limit", 1000, type=int), 1), 10000)
+            offset = max(request.args.get("offset", 0, type=int), 0)
+            tweets = tweet_archive.query_tweets(
+                query=request.args.get("searchQuery"),
+                since=request.args.get("since", type=float),
+                until=request.args.get("until", type=float),
+                sentiment=sentiment,
+                limit=limit,
+                offset=offset
+            )
             return jsonify({
-                "error": str(e),
-                "message": "Failed to retrieve translation"
-            }), 500
-    
-    # New endpoint for listing all available translations
-    @search_bp.route("/api/translations", methods=['GET'])
-    def list_translations():
-        """Endpoint to list all available translations"""
-        try:
-            translations_dir = "server/data/translations"
-            if not os.path.exists(translations_dir):
-                return jsonify({"translations": []})
-                
-            translation_files = [f[:-5] for f in os.listdir(translations_dir) if f.endswith('.json')]
-            return jsonify({"translations": translation_files})
+                "count": len(tweets),
+                "offset": offset,
+                "limit": limit,
+                "tweets": tweets.astype(object).where(tweets.notna(), None).to_dict(orient='records')
+            })
         except Exception as e:
-            logger.error(f"Error listing translations: {str(e)}")
+            logger.error(f"Error querying tweet archive: {str(e)}")
             return jsonify({
                 "error": str(e),
-                "message": "Failed to list translations"
+                "message": "Failed to query tweet archive"
             }), 500
     
     app.register_blueprint(search_bp)
\ No newline at end of file
@@ -45,17 +45,26 @@ def register_translation_routes(app):
     @translation_bp.route('/api/translations', methods=['GET'])
     def list_translations():
         """
-        List all available translations
+        List available translations, newest first, one page at a time
+        
+        Query params:
+            offset (int): Number of translations to skip (default 0)
+            limit (int): Page size (default 100, max 1000)
         
         Returns:
-            JSON response with list of all translations
+            JSON response with one page of translations and the total count
         """
         try:
-            translations = data_cleaner.translator.get_saved_translations()
+            offset = max(request.args.get('offset', 0, type=int), 0)
+            limit = min(max(request.args.get('limit', 100, type=int), 1), 1000)
+            translations = data_cleaner.translator.get_saved_translations(offset=offset, limit=limit)
             
             return jsonify({
                 'success': True,
                 'count': len(translations),
+                'total': data_cleaner.translator.count_saved_translations(),
+                'offset': offset,
+                'limit': limit,
                 'translations': translations
             })
             
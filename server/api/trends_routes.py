@@ -2,12 +2,32 @@
 from flask import jsonify, request
 import logging
 from services.twitter_service import TwitterService
-from config.config import TwitterConfig
+from services.coalescing_cache import CoalescingCache
+from services.trends_aggregator import TrendsAggregator
+from concurrent.futures import ThreadPoolExecutor
+from config.config import TwitterConfig, TrendsConfig
 from config.constants import COUNTRIES_WOEID
 
 # Initialize services
 twitter_config = TwitterConfig()
 twitter_service = TwitterService(twitter_config)
+trends_config = TrendsConfig()
+trends_cache = CoalescingCache(
+    ttl=trends_config.CACHE_TTL,
+    stale_ttl=trends_config.STALE_TTL,
+    max_entries=trends_config.CACHE_MAX_ENTRIES,
+    name="trends"
+)
+trends_aggregator = TrendsAggregator()
+bulk_executor = ThreadPoolExecutor(max_workers=trends_config.BULK_WORKERS, thread_name_prefix="trends")
+
+def get_trends(woeid):
+    """Trends for a WOEID through the shared TTL cache"""
+    return trends_cache.get(woeid, lambda: twitter_service.fetch_trends(woeid))
+
+def get_trends_with_timestamp(woeid):
+    """(trends, loaded_at) for a WOEID, both from the same cache entry"""
+    return trends_cache.get_with_timestamp(woeid, lambda: twitter_service.fetch_trends(woeid))
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -21,10 +41,8 @@ def register_trends_routes(app):
             woeid = COUNTRIES_WOEID.get(country, 1)  # Defaults to Worldwide if not found
             # Log the request
             logger.debug(f"Received trends request for woeid: {woeid}")
-            # Fetch trends data
-            trends_data = twitter_service.fetch_trends(woeid)
-            # Log the trends data before sending
-            logger.debug(f"Fetched trends data: {trends_data}")
+            # Fetch trends data (cached per WOEID)
+            trends_data = get_trends(woeid)
             # Limit trends to 25 (can adjust as needed)
             limited_trends = trends_data[:25]
             # Create the response
@@ -34,12 +52,69 @@ def register_trends_routes(app):
                 "total_trends": len(limited_trends),
                 "woeid": woeid
             }
-            # Log the final response
-            logger.debug(f"Sending response: {response_data}")
             return jsonify(response_data)
         except Exception as e:
             logger.error(f"Error in trends endpoint: {str(e)}")
             return jsonify({
                 "error": str(e),
                 "message": "Failed to fetch trends data"
-            }), 500
\ No newline at end of file
+            }), 500
+
+    @app.route("/api/trends/all", methods=['GET'])
+    def all_trends():
+        """
+        Fetch trends for all (or ?countries=A,B) regions concurrently and merge them.
+
+        Upstream calls share the process-wide rate budget and the per-WOEID cache.
+        Query params:
+            countries (str): Comma-separated COUNTRIES_WOEID names (default: all)
+            minCountries (int): Only list trends present in at least this many countries
+        """
+        requested = request.args.get("countries")
+        if requested:
+            countries = [c.strip() for c in requested.split(",") if c.strip()]
+            unknown = [c for c in countries if c not in COUNTRIES_WOEID]
+            if unknown:
+                return jsonify({"message": f"Unknown countries: {', '.join(unknown)}"}), 400
+        else:
+            countries = list(COUNTRIES_WOEID.keys())
+        min_countries = max(request.args.get("minCountries", 1, type=int), 1)
+
+        futures = {
+            country: bulk_executor.submit(get_trends_with_timestamp, COUNTRIES_WOEID[country])
+            for country in countries
+        }
+        country_trends = {}
+        movements = {}
+        errors = {}
+        for country, future in futures.items():
+            try:
+                trends_data, loaded_at = future.result()
+            except Exception as e:
+                errors[country] = str(e)
+                continue
+            country_trends[country] = trends_data[:25]
+            movements[country] = trends_aggregator.movement(country, country_trends[country], loaded_at)
+
+        return jsonify({
+            "countries": list(country_trends.keys()),
+            "failed_countries": errors,
+            "merged_trends": trends_aggregator.merge(country_trends, movements, min_countries),
+            "by_country": {
+                country: [
+                    {**trend, "rank_change": movements[country].get(trends_aggregator.normalize(trend["name"]))}
+                    for trend in trends
+                ]
+                for country, trends in country_trends.items()
+            }
+        })
+
+    @app.route("/api/trends/cache", methods=['GET'])
+    def trends_cache_stats():
+        """Report trends cache hit/miss counters"""
+        return jsonify(trends_cache.stats())
+
+    @app.route("/api/rate-limit", methods=['GET'])
+    def rate_limit():
+        """Report the shared upstream request budget"""
+        return jsonify(twitter_service.rate_limit_status())
\ No newline at end of file
@@ -2,9 +2,12 @@
 from flask import Flask
 from flask_cors import CORS
 import logging
-from api.search_routes import register_search_routes
+from api.search_routes import register_search_routes, sentiment_analyzer, sentiment_config
 from api.trends_routes import register_trends_routes
 from api.translation_routes import register_translation_routes
+from api.monitor_routes import register_monitor_routes
+from api.health_routes import register_health_routes
+from services.model_registry import model_registry
 
 # Set up logging
 logging.basicConfig(level=logging.DEBUG)
@@ -17,6 +20,15 @@ cors = CORS(app, origins='*')
 register_search_routes(app)
 register_trends_routes(app)
 register_translation_routes(app)
+register_monitor_routes(app)
+register_health_routes(app)
+
+# Load and warm up the sentiment model at startup instead of on the first request
+if sentiment_config.EAGER_LOAD:
+    model_registry.start_warm_up(sentiment_analyzer)
+else:
+    # The model loads on the first request, so readiness must not wait for a warm-up
+    model_registry.require_warm_up = False
 
 if __name__ == "__main__":
     app.run(debug=True, port=8081)
\ No newline at end of file
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 @dataclass
 class TwitterConfig:
@@ -8,6 +8,15 @@ class TwitterConfig:
     TRENDS_URL: str = "https://twitter154.p.rapidapi.com/trends/"  # Keep the trailing slash
     DEFAULT_SEARCH_PARAMS: dict = None
     DEFAULT_TRENDS_PARAMS: dict = None
+    MAX_PAGES: int = 8  # Search result pages fetched per query
+    CONNECT_TIMEOUT: float = 5.0  # Seconds to establish a connection
+    READ_TIMEOUT: float = 30.0  # Seconds to wait for response data
+    MAX_RETRIES: int = 3  # Retries for connection errors, 429 and 5xx responses (each takes a rate-limit token)
+    BACKOFF_FACTOR: float = 0.5  # Exponential backoff base between retries
+    POOL_CONNECTIONS: int = 4  # Number of hosts to keep pools for
+    POOL_MAXSIZE: int = 16  # Keep-alive connections per host
+    RATE_LIMIT_PER_SECOND: float = 1.0  # Sustained upstream requests per second, shared process-wide
+    RATE_LIMIT_BURST: int = 5  # Requests allowed back-to-back when budget has built up
 
     def __post_init__(self):
         self.DEFAULT_SEARCH_PARAMS = {
@@ -19,4 +28,75 @@ class TwitterConfig:
         }
         self.DEFAULT_TRENDS_PARAMS = {
             "woeid": "1"
-        }
\ No newline at end of file
+        }
+
+@dataclass
+class SentimentConfig:
+    MODEL_PATH: str = "model/sentiment_analysis_model.pt"
+    MODEL_NAME: str = "cardiffnlp/twitter-xlm-roberta-base-sentiment"
+    BUNDLE_PATH: str = "model/sentiment_bundle"  # Used instead of MODEL_NAME/MODEL_PATH once built
+    BATCH_SIZE: int = 32  # Texts per forward pass
+    MAX_LENGTH: int = 128  # Max tokens per text
+    PRECISION: str = "fp32"  # "int8" for dynamic INT8 quantization of linear layers (CPU only)
+    BACKEND: str = "torch"  # "onnx" runs ONNX_PATH with ONNX Runtime; "remote" uses the inference server
+    ONNX_PATH: str = "model/sentiment_analysis_model.onnx"  # Written by python -m services.onnx_export
+    INTRA_OP_THREADS: int = 0  # ONNX Runtime threads per operator, 0 = runtime default
+    INTER_OP_THREADS: int = 0  # ONNX Runtime threads across operators, 0 = runtime default
+    CACHE_ENABLED: bool = True
+    CACHE_PATH: str = "data/sentiment_cache.db"
+    CACHE_MAX_ENTRIES: int = 200000  # Least recently used entries are evicted past this
+    EAGER_LOAD: bool = True  # Load and warm up the model at app startup
+    SCHEDULER_ENABLED: bool = True  # Micro-batch scoring across concurrent requests
+    SCHEDULER_MAX_BATCH: int = 64  # Most texts collected into one shared batch (run in BATCH_SIZE passes)
+    SCHEDULER_MAX_WAIT_MS: float = 10  # Longest a request waits for others to join its batch
+
+@dataclass
+class InferenceServerConfig:
+    ADDRESS: str = "data/inference.sock"  # Unix socket shared by every web worker
+    AUTHKEY: str = "sentiment-inference"  # Handshake key for socket clients
+    BACKEND: str = "torch"  # Model backend inside the server: "torch" or "onnx"
+    PRECISION: str = "fp32"  # "int8" for dynamic quantization (torch backend only)
+    MAX_CONCURRENCY: int = 1  # Forward passes run at once, independent of web worker count
+    THREADS: int = 0  # Intra-op threads per forward pass, 0 = runtime default
+
+@dataclass
+class JobConfig:
+    MAX_WORKERS: int = 4  # Concurrent background pipelines
+    RESULT_TTL: int = 3600  # Seconds a finished job stays pollable
+
+@dataclass
+class SearchConfig:
+    MAX_QUERIES: int = 20  # Queries accepted by one multi-query search
+    FETCH_WORKERS: int = 8  # Concurrent upstream fetches per multi-query search
+    ARCHIVE_PATH: str = "data/tweet_archive.db"  # Embedded archive of scored tweets
+    INCREMENTAL: bool = True  # Reuse archived cleaning/scores for tweet IDs seen before
+    WATERMARK_PATH: str = "data/watermarks.db"  # Newest tweet seen per query
+    RESULT_TTL: int = 60  # Seconds a finished search result is reused for identical searches
+    RESULT_CACHE_MAX_ENTRIES: int = 256  # Distinct searches kept in the result cache
+
+@dataclass
+class LanguageConfig:
+    DETECTION_BACKEND: str = "auto"  # auto, fasttext, langid or langdetect
+    FASTTEXT_MODEL_PATH: str = None  # Path to lid.176.ftz, enables the fastText backend
+    DETECTION_MEMO_SIZE: int = 50000  # Texts whose detected language is memoized
+    TRANSLATION_MEMORY_PATH: str = "data/translation_memory.db"  # Empty to disable the translation memory
+    TRANSLATION_WORKERS: int = 8  # Concurrent translation requests per batch
+    TRANSLATION_STORE_PATH: str = "data/translations.db"  # Indexed store of saved tweet translations
+
+@dataclass
+class MonitorConfig:
+    ENABLED: bool = False  # Start polling at app startup (spends API quota continuously)
+    QUERIES: list = field(default_factory=list)  # Queries polled every QUERY_INTERVAL
+    REGIONS: list = field(default_factory=list)  # COUNTRIES_WOEID names whose top trends are polled
+    QUERY_INTERVAL: int = 300  # Seconds between runs of a monitored query
+    TRENDS_INTERVAL: int = 900  # Seconds between trend refreshes of a monitored region
+    TOP_TRENDS_PER_REGION: int = 3  # Trends per region fed through the pipeline
+    SERIES_CAPACITY: int = 288  # Points kept per topic (24h at 5-minute intervals)
+    MAX_WORKERS: int = 2  # Concurrent monitored pipeline runs
+
+@dataclass
+class TrendsConfig:
+    CACHE_TTL: int = 300  # Seconds trends for a WOEID are served without refreshing
+    STALE_TTL: int = 1800  # Further seconds stale trends are served while refreshing in the background
+    CACHE_MAX_ENTRIES: int = 64  # WOEIDs kept in the cache
+    BULK_WORKERS: int = 8  # Concurrent upstream trend fetches for /api/trends/all
@@ -1,25 +1,139 @@
-import torch
-from transformers import AutoTokenizer, AutoModelForSequenceClassification
+from transformers import AutoTokenizer
 import pandas as pd
 from typing import Tuple
 import numpy as np
-from scipy.special import softmax
+from services.model_registry import model_registry
+from services.inference_scheduler import InferenceScheduler
+from services.model_bundle import is_bundle, load_bundle_model, load_bundle_tokenizer
+
+PROB_COLUMNS = ['negative_prob', 'neutral_prob', 'positive_prob']
+
+def softmax(logits: np.ndarray) -> np.ndarray:
+    """Row-wise softmax of a (batch, classes) logits array"""
+    exp = np.exp(logits - logits.max(axis=-1, keepdims=True))
+    return exp / exp.sum(axis=-1, keepdims=True)
 
 class SentimentAnalyzer:
-    def __init__(self, model_path= None, model_name=None):
+    # fp32: full precision; int8: dynamic INT8 quantization of the linear layers (CPU only)
+    PRECISIONS = ('fp32', 'int8')
+    # torch: eager PyTorch model; onnx: exported graph run by ONNX Runtime (see services/onnx_export.py);
+    # remote: forward passes run in a local inference server process (see services/inference_server.py)
+    BACKENDS = ('torch', 'onnx', 'remote')
+
+    def __init__(self, model_path= None, model_name=None, batch_size=32, max_length=128, cache=None,
+                 registry=None, precision='fp32', backend='torch', onnx_path=None,
+                 intra_op_threads=0, inter_op_threads=0, server_address=None, server_authkey=None,
+                 server_variant=None, bundle_path=None):
+        if precision not in self.PRECISIONS:
+            raise ValueError(f"Unsupported precision '{precision}', expected one of {self.PRECISIONS}")
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unsupported backend '{backend}', expected one of {self.BACKENDS}")
+        if backend != 'torch' and precision != 'fp32':
+            raise ValueError(f"Precision is only selectable for the torch backend, not '{backend}'")
         self.model_path = model_path
         self.model_name = model_name
+        self.batch_size = batch_size
+        self.max_length = max_length
+        self.cache = cache  # Optional SentimentCache shared across requests
+        self.registry = registry or model_registry  # Analyzers with the same model share one instance
+        self.precision = precision
+        self.backend = backend
+        self.onnx_path = onnx_path
+        self.intra_op_threads = intra_op_threads  # 0 lets ONNX Runtime pick
+        self.inter_op_threads = inter_op_threads
+        self.server_address = server_address
+        self.server_authkey = server_authkey
+        self.server_variant = server_variant  # "<backend>-<precision>" the inference server must report
+        # A built bundle (python -m services.model_bundle) replaces the hub name and .pt weights
+        self.bundle_path = bundle_path if is_bundle(bundle_path) else None
         self.tokenizer = None
         self.model = None
-        self.device = 'cuda' if torch.cuda.is_available() else 'cpu'
+        self._input_names = None
+        self.scheduler = None  # Set by use_scheduler to share forward passes across requests
+        if backend == 'torch':
+            # torch is imported lazily so the ONNX backend never pays for it
+            import torch
+            # Dynamically quantized kernels only exist for CPU
+            self.device = 'cuda' if torch.cuda.is_available() and precision == 'fp32' else 'cpu'
+        else:
+            self.device = 'cpu'
 
     def load_model(self):
         if self.model is None or self.tokenizer is None:
-            self.tokenizer = AutoTokenizer.from_pretrained(self.model_name)
-            self.model = AutoModelForSequenceClassification.from_pretrained(self.model_name)
-            self.model.load_state_dict(torch.load(self.model_path))
-            self.model.eval()
-            self.model = self.model.to(self.device)
+            if self.backend == 'onnx':
+                tokenizer, session = self.registry.get_or_load(
+                    ('sentiment-onnx', self.model_name, self.bundle_path, self.onnx_path,
+                     self.intra_op_threads, self.inter_op_threads),
+                    self._load_onnx
+                )
+                # Feed only the inputs the exported graph declares (XLM-R has no token_type_ids)
+                self._input_names = [node.name for node in session.get_inputs()]
+                self.tokenizer, self.model = tokenizer, session
+            elif self.backend == 'remote':
+                self.tokenizer, self.model = self.registry.get_or_load(
+                    ('sentiment-remote', self.model_name, self.bundle_path, self.server_address,
+                     self.server_variant),
+                    self._connect_remote
+                )
+            else:
+                self.tokenizer, self.model = self.registry.get_or_load(
+                    ('sentiment', self.model_name, self.model_path, self.bundle_path, self.device, self.precision),
+                    self._load_from_disk
+                )
+
+    def _load_tokenizer(self):
+        if self.bundle_path:
+            return load_bundle_tokenizer(self.bundle_path)
+        return AutoTokenizer.from_pretrained(self.model_name)
+
+    def _load_from_disk(self):
+        import torch
+
+        tokenizer = self._load_tokenizer()
+        if self.bundle_path:
+            model = load_bundle_model(self.bundle_path)
+        else:
+            from transformers import AutoModelForSequenceClassification
+            model = AutoModelForSequenceClassification.from_pretrained(self.model_name)
+            model.load_state_dict(torch.load(self.model_path))
+        model.eval()
+        if self.precision == 'int8':
+            # Weights of every nn.Linear are stored as INT8, activations are quantized on the fly
+            model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        model = model.to(self.device)
+        return tokenizer, model
+
+    def _load_onnx(self):
+        import onnxruntime as ort
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.intra_op_num_threads = self.intra_op_threads
+        options.inter_op_num_threads = self.inter_op_threads
+        session = ort.InferenceSession(self.onnx_path, sess_options=options,
+                                       providers=['CPUExecutionProvider'])
+        tokenizer = self._load_tokenizer()
+        return tokenizer, session
+
+    def _connect_remote(self):
+        from services.inference_server import InferenceClient
+
+        # Only the tokenizer lives in this process; the model is held by the inference server
+        tokenizer = self._load_tokenizer()
+        return tokenizer, InferenceClient(self.server_address, self.server_authkey, self.server_variant)
+
+    def _forward(self, inputs: dict) -> np.ndarray:
+        """Run one padded batch (dict of int64 numpy arrays) and return its logits"""
+        if self.backend == 'remote':
+            return self.model.forward(inputs)
+        if self.backend == 'onnx':
+            feed = {name: inputs[name] for name in self._input_names}
+            return self.model.run(['logits'], feed)[0]
+
+        import torch
+        with torch.inference_mode():
+            tensors = {k: torch.from_numpy(v).to(self.device) for k, v in inputs.items()}
+            return self.model(**tensors).logits.float().cpu().numpy()
 
     def preprocess(self, text: str) -> str:
         """Preprocess text similar to training"""
@@ -30,23 +144,11 @@ class SentimentAnalyzer:
 
     def get_sentiment_score(self, text: str) -> float:
         """Get sentiment score for a single text"""
-        self.load_model()  # Load model only when needed
-        # Preprocess text
-        text = self.preprocess(text)
-        
-        # Tokenize
-        inputs = self.tokenizer(text, return_tensors='pt', truncation=True, max_length=128)
-        inputs = {k: v.to(self.device) for k, v in inputs.items()}
-        
-        # Get prediction
-        with torch.no_grad():
-            outputs = self.model(**inputs)
-            scores = outputs.logits[0].cpu().numpy()
-            scores = softmax(scores)
-            
+        probs = self.predict_proba([text])[0]
+
         # Convert to compound score similar to VADER (-1 to 1 range)
         # Assuming scores[0] is negative, scores[1] is neutral, scores[2] is positive
-        compound = (scores[2] - scores[0]) # Will be between -1 and 1
+        compound = (probs[2] - probs[0]) # Will be between -1 and 1
         
         return float(compound)
 
@@ -59,11 +161,155 @@ class SentimentAnalyzer:
             return 'negative'
         return 'neutral'
 
+    @staticmethod
+    def classify_scores(scores: np.ndarray) -> np.ndarray:
+        """Vectorized version of classify_sentiment for an array of scores"""
+        scores = np.asarray(scores, dtype=float)
+        return np.select(
+            [scores >= 0.05, scores <= -0.05],
+            ['positive', 'negative'],
+            default='neutral'
+        )
+
+    def predict_proba(self, texts: list, batch_size: int = None, progress_callback=None) -> np.ndarray:
+        """
+        Score texts and return class probabilities.
+
+        When a cache is configured, only texts whose preprocessed form has not
+        been scored before by the same model are sent to the model. Duplicate
+        texts within one call are scored once.
+
+        Args:
+            texts (list): Raw texts to score
+            batch_size (int, optional): Micro-batch size, defaults to self.batch_size
+            progress_callback (callable, optional): Called as progress_callback(scored, total)
+                        after each micro-batch
+
+        Returns:
+            np.ndarray: Array of shape (len(texts), 3) with negative, neutral
+                        and positive probabilities
+        """
+        probs = np.zeros((len(texts), 3), dtype=np.float32)
+        if not texts:
+            return probs
+
+        processed_texts = [self.preprocess(str(text)) for text in texts]
+        if self.cache is None:
+            return self._run_inference(processed_texts, batch_size, progress_callback)
+
+        keys = [self.cache.make_key(text) for text in processed_texts]
+        cached = self.cache.get_many(keys)
+
+        # Score each distinct missing text once
+        missing = {}
+        for key, text in zip(keys, processed_texts):
+            if key not in cached and key not in missing:
+                missing[key] = text
+
+        if missing:
+            cached_count = sum(1 for key in keys if key in cached)
+            # Report progress over all texts, counting cache hits as already scored
+            inner_callback = (
+                (lambda done, _: progress_callback(min(cached_count + done, len(texts)), len(texts)))
+                if progress_callback is not None else None
+            )
+            missing_probs = self._run_inference(list(missing.values()), batch_size, inner_callback)
+            scored = dict(zip(missing.keys(), missing_probs))
+            self.cache.put_many(scored)
+            cached.update(scored)
+
+        for i, key in enumerate(keys):
+            probs[i] = cached[key]
+        if progress_callback is not None:
+            progress_callback(len(texts), len(texts))
+        return probs
+
+    def use_scheduler(self, max_batch_size: int = 64, max_wait_ms: float = 10) -> InferenceScheduler:
+        """
+        Route all scoring through one micro-batching consumer thread shared by every caller.
+
+        Each shared batch still runs in forward passes of self.batch_size texts.
+        """
+        self.scheduler = InferenceScheduler(self._infer, max_batch_size, max_wait_ms, self.batch_size)
+        return self.scheduler
+
+    def _run_inference(self, processed_texts: list, batch_size: int = None, progress_callback=None) -> np.ndarray:
+        """Score preprocessed texts, through the shared scheduler when one is configured"""
+        if self.scheduler is not None:
+            return self.scheduler.infer(processed_texts, progress_callback)
+        return self._infer(processed_texts, batch_size, progress_callback)
+
+    def _infer(self, processed_texts: list, batch_size: int = None, progress_callback=None) -> np.ndarray:
+        """
+        Run the model over preprocessed texts in micro-batches.
+
+        Texts are tokenized once without padding, sorted by token length and
+        grouped into batches so each batch only pads up to its own longest
+        sequence. Results are returned in the original input order.
+        """
+        probs = np.zeros((len(processed_texts), 3), dtype=np.float32)
+        if not processed_texts:
+            return probs
+
+        self.load_model()
+        batch_size = batch_size or self.batch_size
+
+        encoded = self.tokenizer(processed_texts, truncation=True, max_length=self.max_length)
+        input_ids = encoded['input_ids']
+        order = np.argsort([len(ids) for ids in input_ids], kind='stable')
+
+        for start in range(0, len(order), batch_size):
+            batch_idx = order[start:start + batch_size]
+            features = [{k: encoded[k][i] for k in encoded.keys()} for i in batch_idx]
+            inputs = self.tokenizer.pad(features, padding=True, return_tensors='np')
+            inputs = {k: v.astype(np.int64) for k, v in inputs.items()}
+            probs[batch_idx] = softmax(self._forward(inputs))
+            if progress_callback is not None:
+                progress_callback(min(start + batch_size, len(order)), len(order))
+
+        return probs
+
+    def score_dataframe(self, df: pd.DataFrame, text_column: str = 'cleaned_text',
+                        progress_callback=None) -> pd.DataFrame:
+        """
+        Add sentiment_score, sentiment and class probability columns to the dataframe
+        using batched inference over the whole text column.
+        """
+        probs = self.predict_proba(df[text_column].tolist(), progress_callback=progress_callback)
+        return self._assign_scores(df, probs)
+
+    def score_dataframes(self, dfs: list, text_column: str = 'cleaned_text',
+                         progress_callback=None) -> list:
+        """
+        Score several dataframes with one shared set of model batches.
+
+        Texts from all dataframes are merged before inference so small frames
+        fill batches together instead of each running its own forward passes.
+        """
+        texts = []
+        for df in dfs:
+            texts.extend(df[text_column].tolist())
+        probs = self.predict_proba(texts, progress_callback=progress_callback)
+
+        offset = 0
+        for df in dfs:
+            self._assign_scores(df, probs[offset:offset + len(df)])
+            offset += len(df)
+        return dfs
+
+    def _assign_scores(self, df: pd.DataFrame, probs: np.ndarray) -> pd.DataFrame:
+        """Write sentiment_score, sentiment and probability columns from a probability array"""
+        scores = probs[:, 2] - probs[:, 0]  # Positive - Negative
+
+        df['sentiment_score'] = scores.astype(float)
+        df['sentiment'] = self.classify_scores(scores)
+        for i, column in enumerate(PROB_COLUMNS):
+            df[column] = probs[:, i].astype(float)
+        return df
+
     def analyze_dataframe(self, df: pd.DataFrame) -> Tuple[int, float, float, float]:
         """Analyze sentiment for entire dataframe"""
-        # Process in batches for efficiency
-        df = self.analyze_text_batch(df['cleaned_text'].tolist())
-        df['sentiment'] = df['sentiment_score'].apply(self.classify_sentiment)
+        df = self.score_dataframe(df)
 
         sentiment_counts = df['sentiment'].value_counts()
         total = len(df)
@@ -77,33 +323,17 @@ class SentimentAnalyzer:
 
     def analyze_text_batch(self, texts: list) -> pd.DataFrame:
         """Analyze a batch of texts and return detailed results"""
-        # Preprocess all texts
-        processed_texts = [self.preprocess(text) for text in texts]
-        
-        # Tokenize
-        inputs = self.tokenizer(processed_texts, return_tensors='pt', padding=True, truncation=True, max_length=128)
-        inputs = {k: v.to(self.device) for k, v in inputs.items()}
-        
-        # Get predictions
-        results = []
-        with torch.no_grad():
-            outputs = self.model(**inputs)
-            scores = outputs.logits.cpu().numpy()
-            scores = softmax(scores, axis=1)
-            
-            for text, score in zip(texts, scores):
-                compound = score[2] - score[0]  # Positive - Negative
-                sentiment = self.classify_sentiment(compound)
-                results.append({
-                    'text': text,
-                    'sentiment': sentiment,
-                    'score': compound,
-                    'negative_prob': score[0],
-                    'neutral_prob': score[1],
-                    'positive_prob': score[2]
-                })
-        
-        return pd.DataFrame(results)
+        probs = self.predict_proba(texts)
+        scores = probs[:, 2] - probs[:, 0]  # Positive - Negative
+
+        return pd.DataFrame({
+            'text': texts,
+            'sentiment': self.classify_scores(scores),
+            'score': scores.astype(float),
+            'negative_prob': probs[:, 0],
+            'neutral_prob': probs[:, 1],
+            'positive_prob': probs[:, 2]
+        })
     
 class EngagementAnalyzer:
     def __init__(self, sentiment_analyzer):
@@ -119,8 +349,7 @@ class EngagementAnalyzer:
         """Format engagement metrics in the desired structure"""
         # First, add sentiment to each tweet
         if 'sentiment' not in df.columns:
-            df['sentiment_score'] = df['cleaned_text'].apply(self.sentiment_analyzer.get_sentiment_score)
-            df['sentiment'] = df['sentiment_score'].apply(self.sentiment_analyzer.classify_sentiment)
+            df = self.sentiment_analyzer.score_dataframe(df)
         
         # Debug print
         print("DataFrame shape:", df.shape)
@@ -151,12 +380,14 @@ class EngagementAnalyzer:
             
         return formatted_metrics
 
-    def analyze(self, df: pd.DataFrame) -> dict:
+    def analyze(self, df: pd.DataFrame, progress_callback=None) -> dict:
         """Perform sentiment and engagement analysis"""
-        # Add sentiment analysis
-        df['sentiment_score'] = df['cleaned_text'].apply(self.sentiment_analyzer.get_sentiment_score)
-        df['sentiment'] = df['sentiment_score'].apply(self.sentiment_analyzer.classify_sentiment)
-        
+        # Add sentiment analysis (batched over the whole dataframe)
+        df = self.sentiment_analyzer.score_dataframe(df, progress_callback=progress_callback)
+        return self.summarize(df)
+
+    def summarize(self, df: pd.DataFrame) -> dict:
+        """Build sentiment percentages and engagement metrics for an already scored dataframe"""
         # Calculate sentiment percentages
         sentiment_counts = df['sentiment'].value_counts()
         total = len(df)
@@ -177,4 +408,69 @@ class EngagementAnalyzer:
         return {
             "sentiment_analysis": sentiment_analysis,
             "engagement_metrics": engagement_metrics
-        }
\ No newline at end of file
+        }
+
+
+class RunningSentimentStats:
+    """
+    Incrementally maintained sentiment percentages and engagement means.
+
+    Each update only aggregates the new page of scored tweets into running
+    counts and sums, so snapshots after every page cost O(page) rather than
+    recomputing over everything seen so far.
+    """
+
+    SENTIMENTS = ('positive', 'neutral', 'negative')
+
+    def __init__(self, metrics=None, metric_names=None):
+        self.metrics = metrics or ['favorite_count', 'retweet_count', 'reply_count']
+        self.metric_names = metric_names or {
+            'favorite_count': 'Likes',
+            'retweet_count': 'Retweets',
+            'reply_count': 'Replies'
+        }
+        self.total = 0
+        self.counts = {sentiment: 0 for sentiment in self.SENTIMENTS}
+        self.sums = {sentiment: {metric: 0.0 for metric in self.metrics} for sentiment in self.SENTIMENTS}
+
+    def update(self, df: pd.DataFrame) -> None:
+        """Fold a scored page (needs a 'sentiment' column) into the running aggregates"""
+        if df.empty:
+            return
+        values = df[self.metrics].apply(pd.to_numeric, errors='coerce').fillna(0)
+        grouped = values.groupby(df['sentiment']).agg(['sum', 'count'])
+
+        for sentiment in grouped.index:
+            if sentiment not in self.counts:
+                continue
+            self.counts[sentiment] += int(grouped.loc[sentiment, (self.metrics[0], 'count')])
+            for metric in self.metrics:
+                self.sums[sentiment][metric] += float(grouped.loc[sentiment, (metric, 'sum')])
+        self.total += len(df)
+
+    def snapshot(self) -> dict:
+        """Current aggregates in the same shape as EngagementAnalyzer.analyze"""
+        def percentage(sentiment):
+            return round((self.counts[sentiment] / self.total) * 100, 1) if self.total else 0
+
+        def mean(sentiment, metric):
+            count = self.counts[sentiment]
+            return round(self.sums[sentiment][metric] / count, 1) if count else 0
+
+        return {
+            "sentiment_analysis": {
+                "total": self.total,
+                "positive_percentage": percentage('positive'),
+                "negative_percentage": percentage('negative'),
+                "neutral_percentage": percentage('neutral')
+            },
+            "engagement_metrics": [
+                {
+                    "metric": self.metric_names[metric],
+                    "positive": mean('positive', metric),
+                    "neutral": mean('neutral', metric),
+                    "negative": mean('negative', metric)
+                }
+                for metric in self.metrics
+            ]
+        }
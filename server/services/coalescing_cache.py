@@ -0,0 +1,119 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+class CoalescingCache:
+    """
+    In-memory TTL cache with request coalescing and stale-while-revalidate.
+
+    - Fresh entries (younger than ttl) are served directly.
+    - Stale entries (younger than ttl + stale_ttl) are served immediately while a
+      single background refresh runs.
+    - On a miss only one caller runs the loader; concurrent callers for the same
+      key wait for that result instead of issuing their own upstream call.
+    """
+
+    def __init__(self, ttl: float, stale_ttl: float = 0, max_entries: int = 256,
+                 refresh_workers: int = 2, name: str = "cache"):
+        self.logger = logging.getLogger(__name__)
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self.name = name
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._inflight: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=refresh_workers, thread_name_prefix=f"{name}-refresh")
+        self._stats = {"hits": 0, "stale_hits": 0, "misses": 0, "coalesced": 0,
+                       "refreshes": 0, "errors": 0}
+
+    def get(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for key, loading it with loader() when needed.
+
+        Loader exceptions propagate to every caller waiting on that load and
+        nothing is cached for the key.
+        """
+        return self.get_with_timestamp(key, loader)[0]
+
+    def get_with_timestamp(self, key: Hashable, loader: Callable[[], Any]) -> Tuple[Any, float]:
+        """Like get(), but returns (value, loaded_at) taken from the same cache entry"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, loaded_at = entry
+                age = time.time() - loaded_at
+                if age < self.ttl:
+                    self._stats["hits"] += 1
+                    self._entries.move_to_end(key)
+                    return entry
+                if age < self.ttl + self.stale_ttl:
+                    self._stats["stale_hits"] += 1
+                    self._entries.move_to_end(key)
+                    if key not in self._inflight:
+                        self._inflight[key] = Future()
+                        self._stats["refreshes"] += 1
+                        self._executor.submit(self._load, key, loader, self._inflight[key])
+                    return entry
+
+            self._stats["misses"] += 1
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+            else:
+                self._stats["coalesced"] += 1
+
+        if leader:
+            self._load(key, loader, future)
+        return future.result()
+
+    def _load(self, key: Hashable, loader: Callable[[], Any], future: Future) -> None:
+        try:
+            value = loader()
+        except Exception as e:
+            self._resolve(key, future, error=e)
+            return
+        self._resolve(key, future, value)
+
+    def _resolve(self, key: Hashable, future: Future, value: Any = None, error: Exception = None) -> None:
+        """Finish a load: cache the value or propagate the error to waiters"""
+        if error is not None:
+            with self._lock:
+                self._stats["errors"] += 1
+                if self._inflight.get(key) is future:
+                    self._inflight.pop(key)
+            self.logger.error(f"{self.name} load failed for {key!r}: {str(error)}")
+            future.set_exception(error)
+            return
+
+        entry = (value, time.time())
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            if self._inflight.get(key) is future:
+                self._inflight.pop(key)
+        future.set_result(entry)
+
+    def peek(self, key: Hashable):
+        """Cached (value, loaded_at) for key regardless of age, or None"""
+        with self._lock:
+            return self._entries.get(key)
+
+    def invalidate(self, key: Hashable = None) -> None:
+        """Drop one key, or everything if key is None"""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self._stats, "entries": len(self._entries), "in_flight": len(self._inflight),
+                    "ttl": self.ttl, "stale_ttl": self.stale_ttl}
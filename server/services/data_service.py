@@ -2,6 +2,10 @@ import re
 import pandas as pd
 from services.language_translator import LanguageTranslator
 
+# Precompiled patterns shared by the per-tweet and vectorized cleaning paths
+STRIP_PATTERN = re.compile(r'http\S+|www\S+|https\S+|@\w+|#\w+', flags=re.MULTILINE)
+NON_WORD_PATTERN = re.compile(r'\W+')
+
 class DataCleaner:
     def __init__(self):
         self.translator = LanguageTranslator()
@@ -10,11 +14,19 @@ class DataCleaner:
         """Basic tweet preprocessing without translation"""
         if not isinstance(tweet, str):
             tweet = str(tweet)
-        tweet = re.sub(r'http\S+|www\S+|https\S+', '', tweet, flags=re.MULTILINE)
-        tweet = re.sub(r'@\w+|#\w+', '', tweet)
-        tweet = re.sub(r'\W+', ' ', tweet)
+        tweet = STRIP_PATTERN.sub('', tweet)
+        tweet = NON_WORD_PATTERN.sub(' ', tweet)
         return tweet.lower()
 
+    def preprocess_series(self, texts: pd.Series) -> pd.Series:
+        """Vectorized preprocess_tweet over a whole column"""
+        return (
+            texts.astype(str)
+            .str.replace(STRIP_PATTERN, '', regex=True)
+            .str.replace(NON_WORD_PATTERN, ' ', regex=True)
+            .str.lower()
+        )
+
     def clean_dataframe(self, df: pd.DataFrame, query=None) -> pd.DataFrame:
         """
         Clean dataframe and handle translations in the background
@@ -26,39 +38,54 @@ class DataCleaner:
         Returns:
             pd.DataFrame: Cleaned DataFrame with language detection info
         """
+        df, translation_data = self.clean_page(df)
+        
+        # Save translations to file if any were found
+        if translation_data:
+            self.translator.save_translations(translation_data, query)
+            
+        return df
+
+    def clean_page(self, df: pd.DataFrame):
+        """
+        Clean one page (or any chunk) of tweets without saving translations,
+        so pages can be cleaned as they stream in and saved together later.
+        
+        Args:
+            df (pd.DataFrame): DataFrame with tweet data
+            
+        Returns:
+            tuple: (cleaned DataFrame, list of translation records)
+        """
         # Drop rows with empty text
         df = df.dropna(subset=['text'])
-        df = df[df['text'].str.strip().astype(bool)]
+        df = df[df['text'].str.strip().astype(bool)].copy()
         
         # Apply standard preprocessing
-        df['cleaned_text'] = df['text'].apply(self.preprocess_tweet)
+        df['cleaned_text'] = self.preprocess_series(df['text'])
         
-        # Process translations in the background
-        translation_data = []
+        # Detect languages for the whole page, then translate only non-English rows
+        texts = df['text'].tolist()
+        lang_codes = pd.Series(self.translator.detect_languages(texts), index=df.index)
+        non_english = lang_codes[lang_codes != 'en']
         
-        for _, row in df.iterrows():
-            # Detect language
-            lang_code = self.translator.detect_language(row['text'])
-            
-            # Only process non-English text
-            if lang_code != 'en':
-                translation_result = self.translator.translate_text(row['text'], source_lang=lang_code)
-                
-                if translation_result['translated']:
-                    # Add tweet ID to translation record
-                    translation_result['id'] = row['id'] 
-                    translation_data.append(translation_result)
-                    
-                    # Add language info to dataframe
-                    df.loc[df['id'] == row['id'], 'original_lang'] = lang_code
-            else:
-                df.loc[df['id'] == row['id'], 'original_lang'] = 'en'
+        translation_data = []
+        translated_index = []
+        translation_results = self.translator.translate_batch(
+            df.loc[non_english.index, 'text'].tolist(), non_english.tolist()
+        )
+        for index, translation_result in zip(non_english.index, translation_results):
+            if translation_result['translated']:
+                # Add tweet ID to translation record
+                translation_result['id'] = df.at[index, 'id']
+                translation_data.append(translation_result)
+                translated_index.append(index)
         
-        # Save translations to file if any were found
-        if translation_data:
-            self.translator.save_translations(translation_data, query)
+        # English rows and successfully translated rows carry their language code
+        has_lang = (lang_codes == 'en') | lang_codes.index.isin(translated_index)
+        df['original_lang'] = lang_codes.where(has_lang)
             
-        return df
+        return df, translation_data
         
     def get_translation_for_tweet(self, tweet_id):
         """
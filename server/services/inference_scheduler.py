@@ -0,0 +1,129 @@
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Dict, List
+
+import numpy as np
+
+class InferenceScheduler:
+    """
+    Cross-request micro-batching in front of one shared model.
+
+    Callers from any thread enqueue texts; a single consumer thread collects
+    queued requests into one batch until it holds max_batch_size texts or
+    max_wait_ms has passed since the first of them arrived, scores the batch
+    in forward passes of at most batch_size texts and resolves each caller's
+    future with its slice of the result. Large requests are split into
+    max_batch_size chunks and each caller only has one chunk queued at a time,
+    so a small request arriving mid-way waits for at most one batch instead of
+    the whole large request.
+    """
+
+    def __init__(self, infer: Callable[[List[str], int], np.ndarray], max_batch_size: int = 64,
+                 max_wait_ms: float = 10, batch_size: int = None, name: str = "inference-scheduler"):
+        """
+        Args:
+            infer (callable): infer(texts, batch_size) -> (len(texts), 3) probabilities
+            max_batch_size (int): Most texts collected into one shared batch
+            max_wait_ms (float): Longest a request waits for others to join its batch
+            batch_size (int, optional): Most texts per forward pass (default: max_batch_size)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.infer_batch = infer
+        self.max_batch_size = max_batch_size
+        self.batch_size = batch_size or max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self._queue: "queue.Queue[tuple]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._stats = {"requests": 0, "batches": 0, "texts": 0, "errors": 0}
+        self._thread = threading.Thread(target=self._loop, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, texts: List[str]) -> Future:
+        """Queue up to max_batch_size texts; the future resolves to their probabilities"""
+        future = Future()
+        self._queue.put((list(texts), future))
+        return future
+
+    def infer(self, texts: List[str], progress_callback=None) -> np.ndarray:
+        """
+        Score texts through the shared batches and block until done.
+
+        Args:
+            texts (list): Preprocessed texts
+            progress_callback (callable, optional): Called as progress_callback(scored, total)
+                        as each chunk completes
+
+        Returns:
+            np.ndarray: Probabilities in input order
+        """
+        if not texts:
+            return np.zeros((0, 3), dtype=np.float32)
+        with self._lock:
+            self._stats["requests"] += 1
+
+        results = []
+        done = 0
+        for start in range(0, len(texts), self.max_batch_size):
+            # The next chunk is queued only after this one resolves, behind anything that arrived meanwhile
+            chunk = texts[start:start + self.max_batch_size]
+            results.append(self.submit(chunk).result())
+            done += len(chunk)
+            if progress_callback is not None:
+                progress_callback(done, len(texts))
+        return np.concatenate(results)
+
+    def _loop(self) -> None:
+        carry = None
+        while True:
+            item = carry or self._queue.get()
+            carry = None
+            batch = [item]
+            size = len(item[0])
+            deadline = time.monotonic() + self.max_wait
+
+            while size < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if size + len(item[0]) > self.max_batch_size:
+                    carry = item  # Starts the next batch
+                    break
+                batch.append(item)
+                size += len(item[0])
+
+            self._run(batch, size)
+
+    def _run(self, batch: List[tuple], size: int) -> None:
+        texts = [text for chunk, _ in batch for text in chunk]
+        try:
+            probs = self.infer_batch(texts, self.batch_size)
+        except Exception as e:
+            self.logger.error(f"Batched inference of {size} texts failed: {str(e)}")
+            with self._lock:
+                self._stats["errors"] += 1
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        with self._lock:
+            self._stats["batches"] += 1
+            self._stats["texts"] += size
+        offset = 0
+        for chunk, future in batch:
+            future.set_result(probs[offset:offset + len(chunk)])
+            offset += len(chunk)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            batches = self._stats["batches"]
+            return {**self._stats, "queued": self._queue.qsize(),
+                    "mean_batch_size": round(self._stats["texts"] / batches, 1) if batches else 0,
+                    "max_batch_size": self.max_batch_size,
+                    "batch_size": self.batch_size, "max_wait_ms": self.max_wait * 1000}
@@ -0,0 +1,218 @@
+import argparse
+import logging
+import os
+import threading
+from multiprocessing import resource_tracker
+from multiprocessing.connection import Client, Listener
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, List
+
+import numpy as np
+
+from config.config import InferenceServerConfig, SentimentConfig
+
+# Requests and replies on the socket are small control tuples; tensors travel through shared memory:
+#   ('infer', shm_name, input_names, batch, seq_len) -> ('ok',) | ('error', message)
+# The block holds each input as a (batch, seq_len) int64 array followed by (batch, num_labels) float32 logits.
+INITIAL_BUFFER_BYTES = 1 << 20
+
+def _buffer_layout(input_count: int, batch: int, seq_len: int, num_labels: int):
+    """Byte offsets of the logits region and total bytes needed"""
+    logits_offset = input_count * batch * seq_len * 8
+    return logits_offset, logits_offset + batch * num_labels * 4
+
+def _attach(name: str) -> SharedMemory:
+    """Attach to a client's block without letting this process's resource tracker unlink it later"""
+    shm = SharedMemory(name=name)
+    resource_tracker.unregister(shm._name, 'shared_memory')
+    return shm
+
+class InferenceServer:
+    """
+    Local inference process that holds the sentiment model once for every web worker.
+
+    Web workers tokenize and pad their texts themselves (tokenizer only, no
+    model), write the padded batch into a shared-memory block they own and send
+    its name over a Unix socket. The server runs the forward pass directly on
+    views of that block and writes the logits back into it, so no tensor data
+    is pickled. At most max_concurrency forward passes run at once, independent
+    of how many clients are connected.
+    """
+
+    def __init__(self, analyzer, address: str, authkey: bytes, max_concurrency: int = 1):
+        self.logger = logging.getLogger(__name__)
+        self.analyzer = analyzer
+        self.address = address
+        self.authkey = authkey
+        self._slots = threading.Semaphore(max_concurrency)
+
+    def serve_forever(self) -> None:
+        self.analyzer.load_model()
+        self.num_labels = self.analyzer._infer(["warm up"]).shape[1]
+
+        if os.path.exists(self.address):
+            os.unlink(self.address)  # Stale socket from a previous run
+        with Listener(self.address, family='AF_UNIX', authkey=self.authkey) as listener:
+            self.logger.info(f"Inference server listening on {self.address}")
+            while True:
+                try:
+                    conn = listener.accept()
+                except Exception as e:
+                    self.logger.error(f"Rejected inference client: {str(e)}")
+                    continue
+                threading.Thread(target=self._handle, args=(conn,), daemon=True).start()
+
+    def _handle(self, conn) -> None:
+        shm = None
+        try:
+            # Clients key cached and archived scores on the backend/precision actually serving them
+            conn.send({"num_labels": self.num_labels, "backend": self.analyzer.backend,
+                       "precision": self.analyzer.precision})
+            while True:
+                try:
+                    _, name, input_names, batch, seq_len = conn.recv()
+                except EOFError:
+                    break
+                try:
+                    if shm is None or shm.name != name:
+                        if shm is not None:
+                            shm.close()
+                        shm = _attach(name)
+                    self._infer(shm, input_names, batch, seq_len)
+                    conn.send(('ok',))
+                except Exception as e:
+                    self.logger.error(f"Inference request failed: {str(e)}")
+                    conn.send(('error', str(e)))
+        finally:
+            if shm is not None:
+                shm.close()
+            conn.close()
+
+    def _infer(self, shm: SharedMemory, input_names: List[str], batch: int, seq_len: int) -> None:
+        size = batch * seq_len * 8
+        inputs = {
+            input_name: np.ndarray((batch, seq_len), dtype=np.int64, buffer=shm.buf, offset=i * size)
+            for i, input_name in enumerate(input_names)
+        }
+        logits_offset, _ = _buffer_layout(len(input_names), batch, seq_len, self.num_labels)
+        logits = np.ndarray((batch, self.num_labels), dtype=np.float32, buffer=shm.buf, offset=logits_offset)
+        with self._slots:
+            logits[:] = self.analyzer._forward(inputs)
+
+class InferenceClient:
+    """
+    Web-worker side of InferenceServer, used as the model of a SentimentAnalyzer
+    with backend='remote'. Thread safe; calls are serialized over one connection.
+
+    With expected_variant ("<backend>-<precision>") set, connecting to a server
+    that reports a different variant fails instead of returning scores that
+    would be cached under the wrong model identity.
+    """
+
+    def __init__(self, address: str, authkey: bytes, expected_variant: str = None):
+        self.address = address
+        self.authkey = authkey
+        self.expected_variant = expected_variant
+        self._lock = threading.Lock()
+        self._conn = None
+        self._shm = None
+        self.num_labels = None
+        self.variant = None
+
+    def _connect(self) -> None:
+        conn = Client(self.address, family='AF_UNIX', authkey=self.authkey)
+        handshake = conn.recv()
+        variant = f"{handshake['backend']}-{handshake['precision']}"
+        if self.expected_variant and variant != self.expected_variant:
+            conn.close()
+            raise RuntimeError(f"Inference server runs {variant}, expected {self.expected_variant}")
+        self._conn = conn
+        self.num_labels = handshake["num_labels"]
+        self.variant = variant
+
+    def _buffer(self, nbytes: int) -> SharedMemory:
+        if self._shm is None or self._shm.size < nbytes:
+            self._release_buffer()
+            self._shm = SharedMemory(create=True, size=max(nbytes, INITIAL_BUFFER_BYTES))
+        return self._shm
+
+    def _release_buffer(self) -> None:
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    def forward(self, inputs: Dict[str, np.ndarray]) -> np.ndarray:
+        """Run one padded batch (dict of int64 arrays of equal shape) on the server and return its logits"""
+        with self._lock:
+            try:
+                return self._forward(inputs)
+            except (EOFError, OSError):
+                # Server restarted: reconnect once and retry
+                self.close_connection()
+                return self._forward(inputs)
+
+    def _forward(self, inputs: Dict[str, np.ndarray]) -> np.ndarray:
+        if self._conn is None:
+            self._connect()
+        input_names = sorted(inputs)
+        batch, seq_len = inputs[input_names[0]].shape
+        logits_offset, nbytes = _buffer_layout(len(input_names), batch, seq_len, self.num_labels)
+        shm = self._buffer(nbytes)
+
+        size = batch * seq_len * 8
+        for i, input_name in enumerate(input_names):
+            view = np.ndarray((batch, seq_len), dtype=np.int64, buffer=shm.buf, offset=i * size)
+            view[:] = inputs[input_name]
+
+        self._conn.send(('infer', shm.name, input_names, batch, seq_len))
+        reply = self._conn.recv()
+        if reply[0] != 'ok':
+            raise RuntimeError(f"Inference server error: {reply[1]}")
+        return np.ndarray((batch, self.num_labels), dtype=np.float32, buffer=shm.buf,
+                          offset=logits_offset).copy()
+
+    def close_connection(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def close(self) -> None:
+        with self._lock:
+            self.close_connection()
+            self._release_buffer()
+
+def main():
+    from services.analytics_service import SentimentAnalyzer
+
+    server_config = InferenceServerConfig()
+    sentiment_config = SentimentConfig()
+    parser = argparse.ArgumentParser(description="Serve sentiment inference to local web workers")
+    parser.add_argument("--address", default=server_config.ADDRESS)
+    parser.add_argument("--backend", default=server_config.BACKEND, choices=['torch', 'onnx'])
+    parser.add_argument("--precision", default=server_config.PRECISION)
+    parser.add_argument("--concurrency", type=int, default=server_config.MAX_CONCURRENCY)
+    parser.add_argument("--threads", type=int, default=server_config.THREADS)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    if args.backend == 'torch' and args.threads:
+        import torch
+        torch.set_num_threads(args.threads)
+
+    analyzer = SentimentAnalyzer(
+        model_path=sentiment_config.MODEL_PATH,
+        model_name=sentiment_config.MODEL_NAME,
+        batch_size=sentiment_config.BATCH_SIZE,
+        max_length=sentiment_config.MAX_LENGTH,
+        precision=args.precision,
+        backend=args.backend,
+        onnx_path=sentiment_config.ONNX_PATH,
+        intra_op_threads=args.threads,
+        bundle_path=sentiment_config.BUNDLE_PATH
+    )
+    InferenceServer(analyzer, args.address, server_config.AUTHKEY.encode('utf-8'),
+                    args.concurrency).serve_forever()
+
+if __name__ == "__main__":
+    main()
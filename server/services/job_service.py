@@ -0,0 +1,141 @@
+import logging
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+class Job:
+    """State of a single background job, including its stage/progress event log"""
+
+    PENDING = 'pending'
+    RUNNING = 'running'
+    COMPLETED = 'completed'
+    FAILED = 'failed'
+
+    def __init__(self, kind: str, params: Dict[str, Any] = None):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.params = params or {}
+        self.status = Job.PENDING
+        self.stage = None
+        self.progress: Dict[str, Any] = {}
+        self.result = None
+        self.error = None
+        self.created_at = time.time()
+        self.finished_at = None
+        self.events: List[Dict[str, Any]] = []
+        self._cond = threading.Condition()
+
+    @property
+    def done(self) -> bool:
+        return self.status in (Job.COMPLETED, Job.FAILED)
+
+    def _push_event(self, event: Dict[str, Any]) -> None:
+        with self._cond:
+            self.events.append(event)
+            self._cond.notify_all()
+
+    def update(self, stage: str, **progress) -> None:
+        """Record that the job entered a stage or made progress within one"""
+        self.stage = stage
+        self.progress.update(progress)
+        self._push_event({"type": "progress", "stage": stage, **progress})
+
+    def publish(self, event_type: str, **data) -> None:
+        """Record an event other than a stage change, e.g. a partial result"""
+        self._push_event({"type": event_type, **data})
+
+    def to_dict(self, include_result: bool = True) -> Dict[str, Any]:
+        data = {
+            "job_id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "stage": self.stage,
+            "progress": self.progress,
+            "created_at": self.created_at,
+            "finished_at": self.finished_at
+        }
+        if self.error is not None:
+            data["error"] = self.error
+        if include_result and self.status == Job.COMPLETED:
+            data["result"] = self.result
+        return data
+
+    def iter_events(self, timeout: float = 15.0) -> Iterator[Optional[Dict[str, Any]]]:
+        """
+        Yield events as they are recorded until the job finishes.
+
+        Yields None when no event arrived within timeout so callers can send
+        keep-alives.
+        """
+        index = 0
+        while True:
+            with self._cond:
+                if index >= len(self.events) and not self.done:
+                    self._cond.wait(timeout)
+                pending = self.events[index:]
+                index = len(self.events)
+                finished = self.done
+            if not pending and not finished:
+                yield None
+            for event in pending:
+                yield event
+            if finished and index >= len(self.events):
+                return
+
+class JobManager:
+    """
+    Runs pipeline jobs on a bounded background executor and tracks their state.
+
+    Finished jobs are kept for result_ttl seconds so clients can poll them.
+    """
+
+    def __init__(self, max_workers: int = 4, result_ttl: int = 3600):
+        self.logger = logging.getLogger(__name__)
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="job")
+        self.result_ttl = result_ttl
+        self._jobs: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, kind: str, func: Callable[[Job], Any], params: Dict[str, Any] = None) -> Job:
+        """
+        Create a job and schedule func(job) on the executor.
+
+        func receives the job so it can call job.update(...) between stages;
+        its return value becomes the job result.
+        """
+        self._prune()
+        job = Job(kind, params)
+        with self._lock:
+            self._jobs[job.id] = job
+        self.executor.submit(self._run, job, func)
+        self.logger.debug(f"Submitted {kind} job {job.id}")
+        return job
+
+    def _run(self, job: Job, func: Callable[[Job], Any]) -> None:
+        job.status = Job.RUNNING
+        job._push_event({"type": "status", "status": Job.RUNNING})
+        try:
+            job.result = func(job)
+            job.status = Job.COMPLETED
+        except Exception as e:
+            self.logger.error(f"Job {job.id} failed: {str(e)}")
+            job.error = str(e)
+            job.status = Job.FAILED
+        finally:
+            job.finished_at = time.time()
+            job._push_event({"type": "status", "status": job.status, "error": job.error})
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _prune(self) -> None:
+        """Drop finished jobs older than result_ttl"""
+        cutoff = time.time() - self.result_ttl
+        with self._lock:
+            expired = [job_id for job_id, job in self._jobs.items()
+                       if job.finished_at is not None and job.finished_at < cutoff]
+            for job_id in expired:
+                del self._jobs[job_id]
@@ -0,0 +1,176 @@
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import List, Optional
+
+# Scripts that identify a language on their own, checked before any model runs
+SCRIPT_LANGUAGES = [
+    (re.compile(r'[\u0900-\u097F]'), 'hi'),  # Devanagari
+    (re.compile(r'[\u0E00-\u0E7F]'), 'th'),  # Thai
+    (re.compile(r'[\uAC00-\uD7AF\u1100-\u11FF]'), 'ko'),  # Hangul
+    (re.compile(r'[\u3040-\u30FF]'), 'ja'),  # Hiragana / Katakana
+]
+URL_MENTION_PATTERN = re.compile(r'http\S+|www\S+|@\w+|#\w+')
+LETTER_PATTERN = re.compile(r'[^\W\d_]')
+
+class LangdetectBackend:
+    """langdetect with a fixed seed so results are reproducible"""
+
+    name = 'langdetect'
+
+    def __init__(self):
+        from langdetect import DetectorFactory, detect, LangDetectException
+        DetectorFactory.seed = 0
+        self._detect = detect
+        self._error = LangDetectException
+
+    def detect_batch(self, texts: List[str]) -> List[Optional[str]]:
+        results = []
+        for text in texts:
+            try:
+                results.append(self._detect(text))
+            except self._error:
+                results.append(None)
+        return results
+
+class LangidBackend:
+    """py3langid: deterministic and much faster than langdetect, model ships with the package"""
+
+    name = 'langid'
+
+    def __init__(self):
+        import py3langid
+        self._classify = py3langid.classify
+
+    def detect_batch(self, texts: List[str]) -> List[Optional[str]]:
+        return [self._classify(text)[0] for text in texts]
+
+class FastTextBackend:
+    """fastText lid.176 model; predicts a whole batch in one call"""
+
+    name = 'fasttext'
+
+    def __init__(self, model_path: str):
+        import fasttext
+        if not model_path or not os.path.exists(model_path):
+            raise FileNotFoundError(f"fastText language model not found: {model_path}")
+        self._model = fasttext.load_model(model_path)
+
+    def detect_batch(self, texts: List[str]) -> List[Optional[str]]:
+        # fastText rejects newlines inside a single input
+        labels, _ = self._model.predict([text.replace('\n', ' ') for text in texts], k=1)
+        return [label[0].replace('__label__', '') if label else None for label in labels]
+
+def create_backend(name: str = 'auto', fasttext_model_path: str = None):
+    """
+    Build a language-ID backend by name.
+
+    'auto' prefers fastText when a model file is configured, then py3langid,
+    then seeded langdetect, depending on what is installed.
+    """
+    logger = logging.getLogger(__name__)
+    if name == 'fasttext':
+        return FastTextBackend(fasttext_model_path)
+    if name == 'langid':
+        return LangidBackend()
+    if name == 'langdetect':
+        return LangdetectBackend()
+    if name != 'auto':
+        raise ValueError(f"Unknown language detection backend: {name}")
+
+    if fasttext_model_path:
+        try:
+            return FastTextBackend(fasttext_model_path)
+        except (ImportError, FileNotFoundError) as e:
+            logger.warning(f"fastText backend unavailable: {str(e)}")
+    try:
+        return LangidBackend()
+    except ImportError:
+        return LangdetectBackend()
+
+class LanguageDetector:
+    """
+    Batch language identification.
+
+    Texts are first checked against cheap script rules (e.g. Devanagari -> 'hi',
+    plain ASCII -> 'en'); only the rest go to the backend model, in one batch.
+    Results are memoized per text in a bounded LRU.
+    """
+
+    def __init__(self, backend=None, default_lang: str = 'en', memo_size: int = 50000):
+        self.logger = logging.getLogger(__name__)
+        self.backend = backend or create_backend()
+        self.default_lang = default_lang
+        self.memo_size = memo_size
+        self._memo = OrderedDict()
+        self._lock = threading.Lock()
+
+    def detect_by_script(self, text: str) -> Optional[str]:
+        """Identify the language from its script alone, or None if the model is needed"""
+        for pattern, lang in SCRIPT_LANGUAGES:
+            if pattern.search(text):
+                return lang
+
+        # Ignore links, mentions and hashtags; ASCII-only prose is treated as English
+        body = URL_MENTION_PATTERN.sub('', text)
+        if not LETTER_PATTERN.search(body):
+            return self.default_lang
+        if body.isascii():
+            return 'en'
+        return None
+
+    def detect(self, text: str) -> str:
+        return self.detect_batch([text])[0]
+
+    def detect_batch(self, texts: List[str]) -> List[str]:
+        """
+        Detect the language of each text.
+
+        Args:
+            texts (list): Texts to identify
+
+        Returns:
+            list: Language codes in input order
+        """
+        results: List[Optional[str]] = [None] * len(texts)
+        pending = {}
+
+        with self._lock:
+            for i, text in enumerate(texts):
+                if not text or not isinstance(text, str):
+                    results[i] = self.default_lang
+                elif text in self._memo:
+                    self._memo.move_to_end(text)
+                    results[i] = self._memo[text]
+                else:
+                    pending.setdefault(text, []).append(i)
+
+        detected = {}
+        model_texts = []
+        for text in pending:
+            lang = self.detect_by_script(text)
+            if lang is None:
+                model_texts.append(text)
+            else:
+                detected[text] = lang
+
+        if model_texts:
+            try:
+                langs = self.backend.detect_batch(model_texts)
+            except Exception as e:
+                self.logger.warning(f"Language detection failed for {len(model_texts)} texts: {str(e)}")
+                langs = [None] * len(model_texts)
+            for text, lang in zip(model_texts, langs):
+                detected[text] = lang or self.default_lang
+
+        with self._lock:
+            for text, lang in detected.items():
+                for i in pending[text]:
+                    results[i] = lang
+                self._memo[text] = lang
+            while len(self._memo) > self.memo_size:
+                self._memo.popitem(last=False)
+
+        return results
@@ -1,13 +1,44 @@
 import logging
-from langdetect import detect, LangDetectException
 from deep_translator import GoogleTranslator
-import json
+from services.language_detection import LanguageDetector, create_backend
+from services.translation_memory import TranslationMemory
+from services.translation_store import TranslationStore
+from config.config import LanguageConfig
+from concurrent.futures import ThreadPoolExecutor
 import os
-from datetime import datetime
+import threading
 
 class LanguageTranslator:
-    def __init__(self, translations_dir="data/translations"):
+    def __init__(self, translations_dir="data/translations", detector=None,
+                 translation_memory=None, translator_factory=None, max_workers=None):
+        """
+        Args:
+            translations_dir (str): Directory for saved translation files
+            detector (LanguageDetector, optional): Language-ID engine
+            translation_memory (TranslationMemory, optional): Persistent store of past translations
+            translator_factory (callable, optional): factory(source, target) returning an object
+                with a translate(text) method; defaults to GoogleTranslator. Pass a local stub
+                to run or benchmark translation offline.
+            max_workers (int, optional): Concurrent translation requests per batch
+        """
         self.logger = logging.getLogger(__name__)
+        language_config = LanguageConfig()
+        if detector is None:
+            detector = LanguageDetector(
+                backend=create_backend(language_config.DETECTION_BACKEND, language_config.FASTTEXT_MODEL_PATH),
+                memo_size=language_config.DETECTION_MEMO_SIZE
+            )
+        self.detector = detector
+        if translation_memory is None and language_config.TRANSLATION_MEMORY_PATH:
+            translation_memory = TranslationMemory(language_config.TRANSLATION_MEMORY_PATH)
+        self.translation_memory = translation_memory
+        self.translator_factory = translator_factory or (
+            lambda source, target: GoogleTranslator(source=source, target=target)
+        )
+        self.max_workers = max_workers or language_config.TRANSLATION_WORKERS
+        self._clients = threading.local()
+        # Long-lived pool so each worker thread keeps its translator clients across batches
+        self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="translate")
         self.supported_languages = {
             'hi': 'Hindi',
             # Add more languages later if needed
@@ -16,6 +47,10 @@ class LanguageTranslator:
         
         # Create translations directory if it doesn't exist
         os.makedirs(self.translations_dir, exist_ok=True)
+
+        # Indexed store; picks up any legacy translations_*.json files once
+        self.store = TranslationStore(language_config.TRANSLATION_STORE_PATH)
+        self.store.import_json_dir(self.translations_dir)
         
     def detect_language(self, text):
         """
@@ -30,13 +65,19 @@ class LanguageTranslator:
         if not text or not isinstance(text, str):
             return 'en'  # Default to English if text is empty or not a string
             
-        try:
-            lang_code = detect(text)
-            self.logger.debug(f"Detected language: {lang_code} for text: {text[:50]}...")
-            return lang_code
-        except LangDetectException as e:
-            self.logger.warning(f"Language detection failed: {str(e)} for text: {text[:50]}...")
-            return 'en'  # Default to English on detection failure
+        return self.detector.detect(text)
+
+    def detect_languages(self, texts):
+        """
+        Detect the language of many texts in one batch.
+        
+        Args:
+            texts (list): The texts to detect languages for
+            
+        Returns:
+            list: Language codes in input order ('en' for empty or undetectable text)
+        """
+        return self.detector.detect_batch(texts)
     
     def translate_text(self, text, source_lang=None, target_lang='en'):
         """
@@ -71,29 +112,94 @@ class LanguageTranslator:
                 'translated': False
             }
             
+        return self.translate_batch([text], [source_lang], target_lang)[0]
+
+    def _should_translate(self, source_lang, target_lang):
         # Only translate if the language is in our supported list or not English
-        if source_lang != 'en' and (source_lang in self.supported_languages or source_lang == 'hi'):
-            try:
-                translator = GoogleTranslator(source=source_lang, target=target_lang)
-                translated_text = translator.translate(text)
-                self.logger.debug(f"Translated from {source_lang} to {target_lang}")
-                
-                return {
+        return (source_lang != target_lang and source_lang != 'en'
+                and (source_lang in self.supported_languages or source_lang == 'hi'))
+
+    def _get_client(self, source_lang, target_lang):
+        """Reuse one translator client per language pair per thread"""
+        clients = getattr(self._clients, 'by_pair', None)
+        if clients is None:
+            clients = self._clients.by_pair = {}
+        key = (source_lang, target_lang)
+        if key not in clients:
+            clients[key] = self.translator_factory(source_lang, target_lang)
+        return clients[key]
+
+    def _translate_one(self, key):
+        source_lang, target_lang, text = key
+        try:
+            translated_text = self._get_client(source_lang, target_lang).translate(text)
+            self.logger.debug(f"Translated from {source_lang} to {target_lang}")
+            return translated_text
+        except Exception as e:
+            self.logger.error(f"Translation error: {str(e)}")
+            return None
+
+    def translate_batch(self, texts, source_langs=None, target_lang='en'):
+        """
+        Translate many texts at once.
+        
+        Identical (source, target, text) inputs are translated once, previously
+        translated texts come from the translation memory, and the remaining
+        misses are sent concurrently over a bounded thread pool.
+        
+        Args:
+            texts (list): Texts to translate
+            source_langs (list, optional): Source language per text; detected if None
+            target_lang (str): Target language code (default: 'en' for English)
+            
+        Returns:
+            list: One translate_text-style result dict per input text
+        """
+        if source_langs is None:
+            source_langs = self.detect_languages(texts)
+        source_langs = [lang if lang is not None else self.detect_language(text)
+                        for text, lang in zip(texts, source_langs)]
+
+        keys = []
+        for text, source_lang in zip(texts, source_langs):
+            if not text or not isinstance(text, str) or text.strip() == '':
+                keys.append(None)
+                continue
+            keys.append((source_lang, target_lang, text) if self._should_translate(source_lang, target_lang) else None)
+
+        unique_keys = list(dict.fromkeys(key for key in keys if key is not None))
+        translations = {}
+        if unique_keys and self.translation_memory is not None:
+            translations = self.translation_memory.get_many(unique_keys)
+
+        misses = [key for key in unique_keys if key not in translations]
+        if misses:
+            fresh = {key: translated for key, translated in zip(misses, self.executor.map(self._translate_one, misses))
+                     if translated is not None}
+            if fresh and self.translation_memory is not None:
+                self.translation_memory.put_many(fresh)
+            translations.update(fresh)
+            self.logger.debug(f"Translated {len(fresh)} of {len(misses)} new texts "
+                              f"({len(unique_keys) - len(misses)} from translation memory)")
+
+        results = []
+        for text, source_lang, key in zip(texts, source_langs, keys):
+            if key is not None and key in translations:
+                results.append({
                     'original_text': text,
-                    'translated_text': translated_text,
-                    'original_lang': source_lang,
+                    'translated_text': translations[key],
+                    'original_lang': key[0],
                     'translated': True
-                }
-            except Exception as e:
-                self.logger.error(f"Translation error: {str(e)}")
-                
-        # Return original if translation failed or wasn't needed
-        return {
-            'original_text': text,
-            'translated_text': text,
-            'original_lang': source_lang,
-            'translated': False
-        }
+                })
+            else:
+                # Return original if translation failed or wasn't needed
+                results.append({
+                    'original_text': text,
+                    'translated_text': text,
+                    'original_lang': source_lang if text and isinstance(text, str) and text.strip() else 'en',
+                    'translated': False
+                })
+        return results
         
     def process_text_batch(self, texts):
         """
@@ -105,22 +211,18 @@ class LanguageTranslator:
         Returns:
             list: List of dictionaries with original and translated texts
         """
-        results = []
-        for text in texts:
-            result = self.translate_text(text)
-            results.append(result)
-        return results
+        return self.translate_batch(texts)
         
     def save_translations(self, translations_data, query=None):
         """
-        Save translations to a JSON file for future reference.
+        Save translations to the indexed translation store for future reference.
         
         Args:
             translations_data (list): List of translation data dictionaries
             query (str, optional): The search query that produced these tweets
             
         Returns:
-            str: Path to the saved file
+            int: Number of translations saved, or None if there was nothing to save
         """
         # Filter out only tweets that were actually translated
         translated_items = [item for item in translations_data if item.get('translated', False)]
@@ -129,64 +231,37 @@ class LanguageTranslator:
             self.logger.info("No translations to save")
             return None
             
-        # Create filename with timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        query_part = f"_{query}" if query else ""
-        filename = f"translations{query_part}_{timestamp}.json"
-        filepath = os.path.join(self.translations_dir, filename)
-        
-        # Write to file
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump({
-                    'timestamp': timestamp,
-                    'query': query,
-                    'count': len(translated_items),
-                    'translations': translated_items
-                }, f, ensure_ascii=False, indent=2)
-            
-            self.logger.info(f"Saved {len(translated_items)} translations to {filepath}")
-            return filepath
+            count = self.store.add_many(translated_items, query)
+            self.logger.info(f"Saved {count} translations to {self.store.db_path}")
+            return count
         except Exception as e:
             self.logger.error(f"Error saving translations: {str(e)}")
             return None
     
-    def get_saved_translations(self, tweet_id=None):
+    def get_saved_translations(self, tweet_id=None, offset=0, limit=None):
         """
         Retrieve saved translations, optionally filtered by tweet ID.
         
         Args:
             tweet_id (str, optional): Specific tweet ID to look for
+            offset (int): Number of translations to skip when listing
+            limit (int, optional): Maximum number of translations to list
             
         Returns:
-            list: List of translation records
+            dict or list: The matching translation record when tweet_id is given
+                          (None if not found), otherwise a list of translation records
         """
-        all_translations = []
-        
         try:
-            # List all translation files
-            for filename in os.listdir(self.translations_dir):
-                if not filename.endswith('.json'):
-                    continue
-                    
-                filepath = os.path.join(self.translations_dir, filename)
-                
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    translation_data = json.load(f)
-                    
-                    # If looking for specific tweet, filter the translations
-                    if tweet_id:
-                        matching_translations = [
-                            t for t in translation_data.get('translations', [])
-                            if t.get('id') == tweet_id
-                        ]
-                        if matching_translations:
-                            return matching_translations[0]
-                    else:
-                        all_translations.extend(translation_data.get('translations', []))
-            
-            return all_translations if not tweet_id else None
+            if tweet_id:
+                return self.store.get(tweet_id)
+            translations, _ = self.store.list(offset, limit)
+            return translations
             
         except Exception as e:
             self.logger.error(f"Error retrieving translations: {str(e)}")
-            return [] if not tweet_id else None
\ No newline at end of file
+            return [] if not tweet_id else None
+
+    def count_saved_translations(self):
+        """Total number of saved translations"""
+        return self.store.list(0, 0)[1]
@@ -0,0 +1,129 @@
+import argparse
+import io
+import json
+import logging
+import os
+import time
+from typing import Dict, List
+
+import numpy as np
+
+from services.analytics_service import SentimentAnalyzer
+from config.config import SentimentConfig
+
+def load_corpus(path: str = "data/latest_tweets.json", column: str = "cleaned_text") -> List[str]:
+    """Fixed evaluation corpus: the non-empty texts of a saved search"""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    tweets = data["tweets"] if isinstance(data, dict) else data
+    return [tweet[column] for tweet in tweets if tweet.get(column, '').strip()]
+
+def model_size_mb(analyzer: SentimentAnalyzer) -> float:
+    """Serialized size of the analyzer's weights, a proxy for its resident weight memory"""
+    if analyzer.backend == 'onnx':
+        return round(os.path.getsize(analyzer.onnx_path) / (1 << 20), 1)
+
+    import torch
+    buffer = io.BytesIO()
+    torch.save(analyzer.model.state_dict(), buffer)
+    return round(buffer.tell() / (1 << 20), 1)
+
+def benchmark(analyzer: SentimentAnalyzer, texts: List[str], batch_size: int = None,
+              repeats: int = 3) -> Dict:
+    """
+    Time batched inference of an analyzer over a corpus.
+
+    Each batch is run on its own so per-batch latency can be reported; the
+    first (warm-up) pass is excluded from the timings.
+
+    Returns:
+        dict: probs (np.ndarray) plus latency and throughput figures
+    """
+    batch_size = batch_size or analyzer.batch_size
+    processed = [analyzer.preprocess(text) for text in texts]
+    batches = [processed[i:i + batch_size] for i in range(0, len(processed), batch_size)]
+
+    started = time.perf_counter()
+    analyzer.load_model()
+    load_seconds = time.perf_counter() - started
+    probs = analyzer._infer(processed, batch_size)
+
+    latencies = []
+    for _ in range(repeats):
+        for batch in batches:
+            started = time.perf_counter()
+            analyzer._infer(batch, batch_size)
+            latencies.append(time.perf_counter() - started)
+
+    total_seconds = sum(latencies)
+    return {
+        "probs": probs,
+        "load_seconds": round(load_seconds, 2),
+        "model_size_mb": model_size_mb(analyzer),
+        "batch_latency_ms_p50": round(float(np.percentile(latencies, 50)) * 1000, 1),
+        "batch_latency_ms_p95": round(float(np.percentile(latencies, 95)) * 1000, 1),
+        "texts_per_second": round(len(processed) * repeats / total_seconds, 1) if total_seconds else None
+    }
+
+def parity(reference: np.ndarray, candidate: np.ndarray) -> Dict:
+    """Agreement between two probability arrays of shape (n, 3)"""
+    reference_scores = reference[:, 2] - reference[:, 0]
+    candidate_scores = candidate[:, 2] - candidate[:, 0]
+    reference_labels = SentimentAnalyzer.classify_scores(reference_scores)
+    candidate_labels = SentimentAnalyzer.classify_scores(candidate_scores)
+    return {
+        "texts": len(reference),
+        "label_agreement": round(float(np.mean(reference_labels == candidate_labels)), 4),
+        "argmax_agreement": round(float(np.mean(reference.argmax(axis=1) == candidate.argmax(axis=1))), 4),
+        "max_prob_diff": round(float(np.max(np.abs(reference - candidate))), 4),
+        "mean_score_diff": round(float(np.mean(np.abs(reference_scores - candidate_scores))), 4)
+    }
+
+def compare(reference: SentimentAnalyzer, candidate: SentimentAnalyzer, texts: List[str],
+            batch_size: int = None, repeats: int = 3) -> Dict:
+    """Accuracy parity and speed of a candidate analyzer against a reference analyzer"""
+    reference_result = benchmark(reference, texts, batch_size, repeats)
+    candidate_result = benchmark(candidate, texts, batch_size, repeats)
+    return {
+        "parity": parity(reference_result.pop("probs"), candidate_result.pop("probs")),
+        "reference": reference_result,
+        "candidate": candidate_result
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare a sentiment inference mode against the FP32 PyTorch model")
+    parser.add_argument("--precision", default="int8", choices=SentimentAnalyzer.PRECISIONS)
+    # The remote backend only forwards to an inference server, so it has nothing local to compare
+    parser.add_argument("--backend", default="torch", choices=('torch', 'onnx'),
+                        help="With --backend onnx the candidate is the exported FP32 graph")
+    parser.add_argument("--threads", type=int, default=0, help="ONNX Runtime intra-op threads")
+    parser.add_argument("--corpus", default="data/latest_tweets.json")
+    parser.add_argument("--batch-size", type=int, default=SentimentConfig.BATCH_SIZE)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--min-agreement", type=float, default=0.97,
+                        help="Exit non-zero if label agreement falls below this")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    config = SentimentConfig()
+    texts = load_corpus(args.corpus)
+
+    def make_analyzer(**kwargs):
+        return SentimentAnalyzer(model_path=config.MODEL_PATH, model_name=config.MODEL_NAME,
+                                 batch_size=args.batch_size, max_length=config.MAX_LENGTH, **kwargs)
+
+    # The reference runs on CPU as well so latency figures are comparable
+    reference = make_analyzer()
+    reference.device = 'cpu'
+    if args.backend == 'onnx':
+        candidate = make_analyzer(backend='onnx', onnx_path=config.ONNX_PATH, intra_op_threads=args.threads)
+    else:
+        candidate = make_analyzer(precision=args.precision)
+    result = compare(reference, candidate, texts, args.batch_size, args.repeats)
+    print(json.dumps(result, indent=2))
+
+    if result["parity"]["label_agreement"] < args.min_agreement:
+        raise SystemExit(f"Label agreement {result['parity']['label_agreement']} below {args.min_agreement}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+import argparse
+import hashlib
+import importlib.util
+import json
+import logging
+import os
+import time
+
+from config.config import SentimentConfig
+
+WEIGHTS_FILE = "model.safetensors"
+MANIFEST_FILE = "bundle.json"
+
+def is_bundle(path: str) -> bool:
+    return bool(path) and os.path.isfile(os.path.join(path, MANIFEST_FILE))
+
+def build_bundle(model_name: str, model_path: str, output_dir: str) -> str:
+    """
+    Package the fine-tuned sentiment model into a self-contained directory.
+
+    The bundle holds the tokenizer files, the model config and the fine-tuned
+    weights as a single safetensors file, so loading needs neither the hub nor
+    a second torch.load of the .pt state dict.
+
+    Args:
+        model_name (str): Hub name of the base model (tokenizer and architecture)
+        model_path (str): Fine-tuned state dict to package
+        output_dir (str): Bundle directory to write
+
+    Returns:
+        str: output_dir
+    """
+    import torch
+    from transformers import AutoTokenizer, AutoModelForSequenceClassification
+
+    logger = logging.getLogger(__name__)
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    model = AutoModelForSequenceClassification.from_pretrained(model_name)
+    model.load_state_dict(torch.load(model_path, map_location='cpu'))
+
+    os.makedirs(output_dir, exist_ok=True)
+    tokenizer.save_pretrained(output_dir)
+    model.save_pretrained(output_dir, safe_serialization=True)
+
+    # Hashed once here so loaders can identify the weights from the manifest alone
+    digest = hashlib.sha256()
+    with open(os.path.join(output_dir, WEIGHTS_FILE), 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+
+    with open(os.path.join(output_dir, MANIFEST_FILE), 'w', encoding='utf-8') as f:
+        json.dump({
+            "model_name": model_name,
+            "source_weights": os.path.abspath(model_path),
+            "weights_file": WEIGHTS_FILE,
+            "weights_sha256": digest.hexdigest(),
+            "built_at": time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+        }, f, indent=2)
+
+    logger.info(f"Built model bundle for {model_name} ({model_path}) in {output_dir}")
+    return output_dir
+
+def bundle_identity(bundle_dir: str) -> str:
+    """Identity of the bundled weights, read from the manifest without touching the weights file"""
+    with open(os.path.join(bundle_dir, MANIFEST_FILE), 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    # Bundles built before digests were recorded are identified by their build time
+    return f"bundle:{manifest.get('weights_sha256') or manifest.get('built_at', '')}"
+
+def load_bundle_tokenizer(bundle_dir: str):
+    from transformers import AutoTokenizer
+    return AutoTokenizer.from_pretrained(bundle_dir, local_files_only=True)
+
+def load_bundle_model(bundle_dir: str):
+    """
+    Load the bundled model fully offline.
+
+    Weights are memory-mapped from the safetensors file. When accelerate is
+    installed they are also assigned directly instead of initialising random
+    weights first and overwriting them (transformers requires it for that).
+    """
+    from transformers import AutoModelForSequenceClassification
+    return AutoModelForSequenceClassification.from_pretrained(
+        bundle_dir, local_files_only=True, use_safetensors=True,
+        low_cpu_mem_usage=importlib.util.find_spec("accelerate") is not None
+    )
+
+def main():
+    config = SentimentConfig()
+    parser = argparse.ArgumentParser(description="Build an offline bundle of the sentiment model")
+    parser.add_argument("--model-name", default=config.MODEL_NAME)
+    parser.add_argument("--model-path", default=config.MODEL_PATH)
+    parser.add_argument("--output", default=config.BUNDLE_PATH)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    build_bundle(args.model_name, args.model_path, args.output)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable
+
+# Short, mixed-length texts so warm-up exercises padding and the batched path
+WARMUP_TEXTS = [
+    "great game tonight",
+    "this is terrible news for everyone involved @user http",
+    "not sure how i feel about the new policy announcement yet",
+    "नमस्ते दुनिया",
+]
+
+class ModelRegistry:
+    """
+    Process-wide registry of loaded models.
+
+    Each (kind, name, path, device, ...) key is loaded exactly once, even when
+    several analyzers request it concurrently, and every analyzer asking for
+    the same key shares the same instance. The registry also tracks warm-up
+    so the app can report readiness before taking traffic.
+    """
+
+    COLD = 'cold'
+    LOADING = 'loading'
+    READY = 'ready'
+    FAILED = 'failed'
+
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+        self._models: Dict[Hashable, Any] = {}
+        self._key_locks: Dict[Hashable, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.state = ModelRegistry.COLD
+        self.error = None
+        self.load_seconds = None
+        # With lazy loading there is no warm-up to wait for, so readiness doesn't depend on it
+        self.require_warm_up = True
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Return the model for key, calling loader() once if it is not loaded yet"""
+        with self._lock:
+            if key in self._models:
+                return self._models[key]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                if key in self._models:
+                    return self._models[key]
+            started = time.time()
+            model = loader()
+            self.logger.info(f"Loaded model {key} in {time.time() - started:.1f}s")
+            with self._lock:
+                self._models[key] = model
+                # A lazy load on a request (or after a failed warm-up) also makes the app ready;
+                # during a warm-up the state only changes once its batch has run
+                if self.state in (ModelRegistry.COLD, ModelRegistry.FAILED):
+                    self.state = ModelRegistry.READY
+                    self.error = None
+            return model
+
+    def warm_up(self, analyzer, texts=None) -> bool:
+        """Load the analyzer's model and run one batch through it to trigger lazy initialisation"""
+        self.state = ModelRegistry.LOADING
+        started = time.time()
+        try:
+            analyzer.load_model()
+            analyzer._infer([analyzer.preprocess(text) for text in (texts or WARMUP_TEXTS)])
+        except Exception as e:
+            self.state = ModelRegistry.FAILED
+            self.error = str(e)
+            self.logger.error(f"Model warm-up failed: {str(e)}")
+            return False
+        self.load_seconds = round(time.time() - started, 2)
+        self.state = ModelRegistry.READY
+        self.error = None
+        self.logger.info(f"Model ready after {self.load_seconds}s warm-up")
+        return True
+
+    def start_warm_up(self, analyzer, texts=None, retry_interval: float = 5,
+                      max_retry_interval: float = 300) -> threading.Thread:
+        """
+        Warm up in a background thread so the app can answer health checks meanwhile.
+
+        A failed warm-up (e.g. the inference server is not up yet) is retried
+        with exponential backoff until it succeeds or a request loads the model.
+        """
+        def run():
+            delay = retry_interval
+            while not self.warm_up(analyzer, texts):
+                time.sleep(delay)
+                if self.state == ModelRegistry.READY:
+                    return
+                delay = min(delay * 2, max_retry_interval)
+
+        thread = threading.Thread(target=run, name="model-warmup", daemon=True)
+        thread.start()
+        return thread
+
+    def is_ready(self) -> bool:
+        return self.state == ModelRegistry.READY or not self.require_warm_up
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            models = [str(key) for key in self._models]
+        return {
+            "state": self.state,
+            "ready": self.is_ready(),
+            "models": models,
+            "load_seconds": self.load_seconds,
+            "error": self.error
+        }
+
+# Shared by every SentimentAnalyzer in the process unless one is given explicitly
+model_registry = ModelRegistry()
@@ -0,0 +1,84 @@
+import argparse
+import logging
+import os
+
+from config.config import SentimentConfig
+
+def export_onnx(model_name: str, model_path: str, output_path: str, opset: int = 14,
+                max_length: int = 128) -> str:
+    """
+    Export the fine-tuned sentiment classifier to ONNX.
+
+    The graph takes input_ids and attention_mask and returns logits; batch and
+    sequence axes are dynamic so SentimentAnalyzer's length-sorted batches can
+    be fed unchanged.
+
+    Args:
+        model_name (str): Hub name of the base model (tokenizer and architecture)
+        model_path (str): Fine-tuned state dict to load into it
+        output_path (str): Where the .onnx file is written
+        opset (int): ONNX opset version
+        max_length (int): Sequence length of the dummy input used for tracing
+
+    Returns:
+        str: output_path
+    """
+    import torch
+    from transformers import AutoTokenizer, AutoModelForSequenceClassification
+
+    logger = logging.getLogger(__name__)
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    model = AutoModelForSequenceClassification.from_pretrained(model_name)
+    model.load_state_dict(torch.load(model_path, map_location='cpu'))
+    model.eval()
+
+    class LogitsOnly(torch.nn.Module):
+        """Return a plain logits tensor instead of a ModelOutput"""
+
+        def __init__(self, inner):
+            super().__init__()
+            self.inner = inner
+
+        def forward(self, input_ids, attention_mask):
+            return self.inner(input_ids=input_ids, attention_mask=attention_mask).logits
+
+    dummy = tokenizer(["export sample text", "a second, somewhat longer export sample text"],
+                      padding=True, truncation=True, max_length=max_length, return_tensors='pt')
+
+    output_dir = os.path.dirname(output_path)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    with torch.inference_mode():
+        torch.onnx.export(
+            LogitsOnly(model),
+            (dummy['input_ids'], dummy['attention_mask']),
+            output_path,
+            input_names=['input_ids', 'attention_mask'],
+            output_names=['logits'],
+            dynamic_axes={
+                'input_ids': {0: 'batch', 1: 'sequence'},
+                'attention_mask': {0: 'batch', 1: 'sequence'},
+                'logits': {0: 'batch'}
+            },
+            opset_version=opset,
+            do_constant_folding=True
+        )
+
+    logger.info(f"Exported {model_name} ({model_path}) to {output_path}")
+    return output_path
+
+def main():
+    config = SentimentConfig()
+    parser = argparse.ArgumentParser(description="Export the sentiment model to ONNX")
+    parser.add_argument("--model-name", default=config.MODEL_NAME)
+    parser.add_argument("--model-path", default=config.MODEL_PATH)
+    parser.add_argument("--output", default=config.ONNX_PATH)
+    parser.add_argument("--opset", type=int, default=14)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    export_onnx(args.model_name, args.model_path, args.output, args.opset, config.MAX_LENGTH)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+import threading
+import time
+from typing import Dict
+
+class TokenBucket:
+    """
+    Thread-safe token-bucket rate limiter.
+
+    Tokens refill continuously at `rate` per second up to `capacity`. Callers
+    reserve tokens in arrival order: when the bucket is empty the balance goes
+    negative and each caller sleeps exactly until its own reservation is
+    covered, so concurrent callers share the budget fairly and nobody sleeps
+    while budget is available.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self._tokens = float(capacity)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Take tokens from the bucket, blocking until they are available.
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """Take tokens only if they are available right now"""
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+
+    def budget(self) -> Dict[str, float]:
+        """Current budget; negative available tokens mean callers are queued"""
+        with self._lock:
+            self._refill(time.monotonic())
+            return {
+                "available_tokens": round(self._tokens, 3),
+                "capacity": self.capacity,
+                "rate_per_second": self.rate
+            }
+
+# One bucket per API credential, shared by every TwitterService in the process
+_buckets: Dict[tuple, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+def get_shared_rate_limiter(config) -> TokenBucket:
+    """Return the process-wide token bucket for the given TwitterConfig credentials"""
+    key = (config.API_KEY, config.API_HOST)
+    with _buckets_lock:
+        bucket = _buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(config.RATE_LIMIT_PER_SECOND, config.RATE_LIMIT_BURST)
+            _buckets[key] = bucket
+        return bucket
@@ -0,0 +1,202 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List
+
+import numpy as np
+
+from services.model_bundle import bundle_identity, is_bundle
+
+class SentimentCache:
+    """
+    Disk-backed, size-bounded cache of sentiment class probabilities.
+
+    Entries are keyed by a hash of the preprocessed text together with the
+    model identity (model name, a hash of the fine-tuned weights file and the
+    inference variant such as the precision), so swapping the model
+    invalidates every cached score automatically. When the
+    cache grows past max_entries the least recently used rows are evicted.
+    """
+
+    def __init__(self, db_path="data/sentiment_cache.db", model_name=None, model_path=None,
+                 max_entries=100000, variant=None, bundle_path=None):
+        self.logger = logging.getLogger(__name__)
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.model_identity = self.model_identity_for(model_name, model_path, variant, bundle_path)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        db_dir = os.path.dirname(db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS sentiment_cache (
+                key TEXT PRIMARY KEY,
+                negative_prob REAL NOT NULL,
+                neutral_prob REAL NOT NULL,
+                positive_prob REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_sentiment_cache_access ON sentiment_cache(last_access)"
+        )
+        self._conn.commit()
+        self._size = self._conn.execute("SELECT COUNT(*) FROM sentiment_cache").fetchone()[0]
+
+    @staticmethod
+    def weights_digest(path: str) -> str:
+        """
+        SHA-256 of a weights file, hashed once and then read from a sidecar file.
+
+        The digest is stored next to the weights as <path>.sha256 together with
+        the file's size and mtime, so workers starting later skip re-hashing
+        (about a gigabyte) unless the weights have changed.
+        """
+        stat = os.stat(path)
+        sidecar = f"{path}.sha256"
+        try:
+            with open(sidecar, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if cached.get("size") == stat.st_size and cached.get("mtime") == stat.st_mtime:
+                return cached["sha256"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        weights_hash = digest.hexdigest()
+        try:
+            with open(sidecar, 'w', encoding='utf-8') as f:
+                json.dump({"size": stat.st_size, "mtime": stat.st_mtime, "sha256": weights_hash}, f)
+        except OSError as e:
+            logging.getLogger(__name__).warning(f"Could not persist weights digest to {sidecar}: {str(e)}")
+        return weights_hash
+
+    @staticmethod
+    def model_identity_for(model_name, model_path, variant=None, bundle_path=None) -> str:
+        """
+        Build a string identifying the model name, the exact weights and the inference variant in use.
+
+        A built model bundle takes precedence (as it does for loading) and is
+        identified by the weights digest in its manifest.
+        """
+        weights_hash = ""
+        if is_bundle(bundle_path):
+            weights_hash = bundle_identity(bundle_path)
+        elif model_path and os.path.exists(model_path):
+            weights_hash = SentimentCache.weights_digest(model_path)
+        elif model_path:
+            weights_hash = str(model_path)
+        identity = f"{model_name or ''}:{weights_hash}"
+        return f"{identity}:{variant}" if variant else identity
+
+    def make_key(self, text: str) -> str:
+        """Hash a preprocessed text together with the model identity"""
+        payload = f"{self.model_identity}\0{text}".encode('utf-8')
+        return hashlib.sha256(payload).hexdigest()
+
+    def get_many(self, keys: List[str]) -> Dict[str, np.ndarray]:
+        """
+        Look up cached probabilities for a batch of keys.
+
+        Args:
+            keys (list): Keys produced by make_key
+
+        Returns:
+            dict: Mapping of key -> probability array for every key that was found
+        """
+        unique_keys = list(dict.fromkeys(keys))
+        found = {}
+        if not unique_keys:
+            return found
+
+        with self._lock:
+            # Stay well below SQLite's bound-parameter limit
+            for start in range(0, len(unique_keys), 500):
+                chunk = unique_keys[start:start + 500]
+                placeholders = ','.join('?' * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT key, negative_prob, neutral_prob, positive_prob "
+                    f"FROM sentiment_cache WHERE key IN ({placeholders})",
+                    chunk
+                ).fetchall()
+                for key, neg, neu, pos in rows:
+                    found[key] = np.array([neg, neu, pos], dtype=np.float32)
+
+            if found:
+                now = time.time()
+                self._conn.executemany(
+                    "UPDATE sentiment_cache SET last_access = ? WHERE key = ?",
+                    [(now, key) for key in found]
+                )
+                self._conn.commit()
+
+            self.hits += len(found)
+            self.misses += len(unique_keys) - len(found)
+
+        return found
+
+    def put_many(self, items: Dict[str, np.ndarray]) -> None:
+        """
+        Store probabilities for a batch of keys and evict LRU entries if over capacity.
+
+        Args:
+            items (dict): Mapping of key -> probability array (negative, neutral, positive)
+        """
+        if not items:
+            return
+
+        now = time.time()
+        rows = [(key, float(p[0]), float(p[1]), float(p[2]), now) for key, p in items.items()]
+
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO sentiment_cache "
+                "(key, negative_prob, neutral_prob, positive_prob, last_access) VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+            self._size = self._conn.execute("SELECT COUNT(*) FROM sentiment_cache").fetchone()[0]
+
+            overflow = self._size - self.max_entries
+            if overflow > 0:
+                self._conn.execute(
+                    "DELETE FROM sentiment_cache WHERE key IN "
+                    "(SELECT key FROM sentiment_cache ORDER BY last_access ASC LIMIT ?)",
+                    (overflow,)
+                )
+                self._size -= overflow
+                self.logger.debug(f"Evicted {overflow} sentiment cache entries")
+
+            self._conn.commit()
+
+    def stats(self) -> dict:
+        """Return cache size and hit/miss counters"""
+        with self._lock:
+            return {
+                "entries": self._size,
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses
+            }
+
+    def clear(self) -> None:
+        """Remove every cached entry"""
+        with self._lock:
+            self._conn.execute("DELETE FROM sentiment_cache")
+            self._conn.commit()
+            self._size = 0
@@ -0,0 +1,242 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+class RingBuffer:
+    """Fixed-capacity float array of rows; once full, each append overwrites the oldest row"""
+
+    def __init__(self, capacity: int, fields: List[str]):
+        self.capacity = capacity
+        self.fields = list(fields)
+        self._data = np.full((capacity, len(self.fields)), np.nan, dtype=np.float64)
+        self._next = 0
+        self._count = 0
+
+    def append(self, row: Dict[str, float]) -> None:
+        self._data[self._next] = [row.get(field, np.nan) for field in self.fields]
+        self._next = (self._next + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def to_array(self) -> np.ndarray:
+        """Rows in chronological order"""
+        if self._count < self.capacity:
+            return self._data[:self._count].copy()
+        return np.concatenate([self._data[self._next:], self._data[:self._next]])
+
+    def to_dict(self) -> Dict[str, list]:
+        """Column-oriented series; NaN becomes None so the result is JSON safe"""
+        values = self.to_array()
+        return {
+            field: [None if np.isnan(v) else float(v) for v in values[:, i]]
+            for i, field in enumerate(self.fields)
+        }
+
+class SeriesStore:
+    """Rolling per-topic time series of sentiment percentages and engagement means"""
+
+    SENTIMENT_FIELDS = ['positive_percentage', 'negative_percentage', 'neutral_percentage']
+    ENGAGEMENT_METRICS = ['Likes', 'Retweets', 'Replies']
+
+    def __init__(self, capacity: int = 288):
+        self.capacity = capacity
+        self.fields = ['timestamp', 'total'] + self.SENTIMENT_FIELDS + [
+            f"{metric.lower()}_{sentiment}"
+            for metric in self.ENGAGEMENT_METRICS
+            for sentiment in ('positive', 'neutral', 'negative')
+        ]
+        self._series: Dict[str, RingBuffer] = {}
+        self._lock = threading.Lock()
+
+    def record(self, topic: str, result: Dict, timestamp: float = None) -> None:
+        """Append one pipeline result (the /api/variable payload) to a topic's series"""
+        sentiment = result.get('sentiment_analysis', {})
+        row = {'timestamp': timestamp or time.time(), 'total': sentiment.get('total', 0)}
+        if row['total']:
+            for field in self.SENTIMENT_FIELDS:
+                row[field] = sentiment.get(field)
+            for metric in result.get('engagement_metrics', []):
+                for key in ('positive', 'neutral', 'negative'):
+                    row[f"{metric['metric'].lower()}_{key}"] = metric.get(key)
+
+        with self._lock:
+            buffer = self._series.get(topic)
+            if buffer is None:
+                buffer = self._series[topic] = RingBuffer(self.capacity, self.fields)
+            buffer.append(row)
+
+    def get(self, topic: str) -> Optional[Dict[str, list]]:
+        with self._lock:
+            buffer = self._series.get(topic)
+            return buffer.to_dict() if buffer is not None else None
+
+    def topics(self) -> List[str]:
+        with self._lock:
+            return list(self._series.keys())
+
+class TopicMonitor:
+    """
+    Background scheduler that periodically runs the search pipeline for monitored
+    queries and for the top trends of monitored regions, recording each run
+    into a SeriesStore so dashboards can read precomputed series.
+    """
+
+    def __init__(self, run_query: Callable[[str], Dict], fetch_trends: Callable[[int], List[Dict]],
+                 series_store: SeriesStore, query_interval: int = 300, trends_interval: int = 900,
+                 top_trends: int = 3, max_workers: int = 2):
+        """
+        Args:
+            run_query (callable): run_query(query) -> /api/variable style result
+            fetch_trends (callable): fetch_trends(woeid) -> list of trend dicts
+            series_store (SeriesStore): Where results are recorded
+            query_interval (int): Default seconds between runs of a monitored query
+            trends_interval (int): Seconds between trend refreshes of a monitored region
+            top_trends (int): Trends per region fed through the pipeline
+            max_workers (int): Concurrent pipeline runs
+        """
+        self.logger = logging.getLogger(__name__)
+        self.run_query = run_query
+        self.fetch_trends = fetch_trends
+        self.series_store = series_store
+        self.query_interval = query_interval
+        self.trends_interval = trends_interval
+        self.top_trends = top_trends
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="monitor")
+
+        self._queries: Dict[str, Dict] = {}
+        self._regions: Dict[str, Dict] = {}
+        self._running = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @staticmethod
+    def _check_interval(interval, default: float) -> float:
+        """Interval in seconds, or default when None; anything but a positive number is rejected"""
+        if interval is None:
+            return default
+        if isinstance(interval, bool) or not isinstance(interval, (int, float)) or interval <= 0:
+            raise ValueError("interval must be a positive number of seconds.")
+        return interval
+
+    def add_query(self, query: str, interval: float = None) -> None:
+        interval = self._check_interval(interval, self.query_interval)
+        with self._lock:
+            self._queries[query] = {"interval": interval, "next_run": 0.0,
+                                    "last_run": None, "last_error": None}
+
+    def remove_query(self, query: str) -> bool:
+        with self._lock:
+            return self._queries.pop(query, None) is not None
+
+    def add_region(self, country: str, woeid: int, interval: float = None) -> None:
+        interval = self._check_interval(interval, self.trends_interval)
+        with self._lock:
+            self._regions[country] = {"woeid": woeid, "interval": interval,
+                                      "next_run": 0.0, "last_run": None, "last_error": None,
+                                      "trends": []}
+
+    def remove_region(self, country: str) -> bool:
+        with self._lock:
+            return self._regions.pop(country, None) is not None
+
+    def status(self) -> Dict:
+        def public(entry):
+            return {key: value for key, value in entry.items() if key != "next_run"}
+
+        with self._lock:
+            return {
+                "running": self._thread is not None and self._thread.is_alive(),
+                "queries": {query: public(entry) for query, entry in self._queries.items()},
+                "regions": {country: public(entry) for country, entry in self._regions.items()}
+            }
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="topic-monitor", daemon=True)
+        self._thread.start()
+        self.logger.info("Topic monitor started")
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            # An unexpected error must not stop the scheduler thread for good
+            try:
+                self._schedule_due()
+            except Exception as e:
+                self.logger.error(f"Topic monitor scheduling failed: {str(e)}")
+            self._stop.wait(1.0)
+
+    def _schedule_due(self) -> None:
+        now = time.time()
+        due = []
+        with self._lock:
+            for kind, entries in (("query", self._queries), ("region", self._regions)):
+                for name, entry in entries.items():
+                    if entry["next_run"] > now or (kind, name) in self._running:
+                        continue
+                    entry["next_run"] = now + entry["interval"]
+                    self._running.add((kind, name))
+                    due.append((kind, name))
+
+        for task in due:
+            self.executor.submit(self._run_task, task)
+
+    def _run_task(self, task) -> None:
+        kind, name = task
+        try:
+            if kind == "query":
+                self._run_query(name)
+            else:
+                self._run_region(name)
+        finally:
+            with self._lock:
+                self._running.discard(task)
+
+    def _set_entry(self, entries: Dict, name: str, **values) -> None:
+        with self._lock:
+            if name in entries:
+                entries[name].update(values)
+
+    def _run_query(self, query: str) -> None:
+        try:
+            result = self.run_query(query)
+            self.series_store.record(query, result)
+            self._set_entry(self._queries, query, last_run=time.time(), last_error=None)
+        except Exception as e:
+            self.logger.error(f"Monitored query '{query}' failed: {str(e)}")
+            self._set_entry(self._queries, query, last_run=time.time(), last_error=str(e))
+
+    def _run_region(self, country: str) -> None:
+        with self._lock:
+            entry = self._regions.get(country)
+            woeid = entry["woeid"] if entry else None
+        if woeid is None:
+            return
+        try:
+            trends = self.fetch_trends(woeid)[:self.top_trends]
+            names = [trend["name"] for trend in trends]
+            self._set_entry(self._regions, country, trends=names)
+            for name in names:
+                self._record_trend(country, name)
+            self._set_entry(self._regions, country, last_run=time.time(), last_error=None)
+        except Exception as e:
+            self.logger.error(f"Monitored region '{country}' failed: {str(e)}")
+            self._set_entry(self._regions, country, last_run=time.time(), last_error=str(e))
+
+    def _record_trend(self, country: str, trend: str) -> None:
+        """Run the pipeline for one of a region's current trends and record it under the trend name"""
+        try:
+            self.series_store.record(trend, self.run_query(trend))
+        except Exception as e:
+            self.logger.error(f"Trend '{trend}' for '{country}' failed: {str(e)}")
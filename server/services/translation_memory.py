@@ -0,0 +1,79 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, Tuple
+
+class TranslationMemory:
+    """
+    Persistent store of previously translated texts.
+
+    Entries are keyed by (source_lang, target_lang, sha256 of the text), so the
+    same retweet text is only ever sent to the translation service once.
+    """
+
+    def __init__(self, db_path="data/translation_memory.db"):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+
+        db_dir = os.path.dirname(db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS translation_memory (
+                source_lang TEXT NOT NULL,
+                target_lang TEXT NOT NULL,
+                text_hash TEXT NOT NULL,
+                translated_text TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (source_lang, target_lang, text_hash)
+            )
+            """
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def hash_text(text: str) -> str:
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+    def get_many(self, keys: Iterable[Tuple[str, str, str]]) -> Dict[Tuple[str, str, str], str]:
+        """
+        Look up translations for (source_lang, target_lang, text) keys.
+
+        Returns:
+            dict: Mapping of key -> translated text for every key that was found
+        """
+        found = {}
+        with self._lock:
+            for source_lang, target_lang, text in keys:
+                row = self._conn.execute(
+                    "SELECT translated_text FROM translation_memory "
+                    "WHERE source_lang = ? AND target_lang = ? AND text_hash = ?",
+                    (source_lang, target_lang, self.hash_text(text))
+                ).fetchone()
+                if row is not None:
+                    found[(source_lang, target_lang, text)] = row[0]
+        return found
+
+    def put_many(self, items: Dict[Tuple[str, str, str], str]) -> None:
+        """Store translations keyed by (source_lang, target_lang, text)"""
+        if not items:
+            return
+        now = time.time()
+        rows = [
+            (source_lang, target_lang, self.hash_text(text), translated, now)
+            for (source_lang, target_lang, text), translated in items.items()
+        ]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO translation_memory "
+                "(source_lang, target_lang, text_hash, translated_text, created_at) VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+            self._conn.commit()
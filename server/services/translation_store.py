@@ -0,0 +1,148 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+class TranslationStore:
+    """
+    Indexed store of saved tweet translations.
+
+    Translations live in one SQLite table keyed by tweet ID, so lookups are a
+    primary-key hit and listings are paginated instead of loading every
+    translations_*.json file ever written.
+    """
+
+    COLUMNS = ('id', 'original_text', 'translated_text', 'original_lang', 'translated', 'query', 'saved_at')
+
+    def __init__(self, db_path="data/translations.db"):
+        self.logger = logging.getLogger(__name__)
+        self.db_path = db_path
+        self._lock = threading.Lock()
+
+        db_dir = os.path.dirname(db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS translations (
+                id TEXT PRIMARY KEY,
+                original_text TEXT,
+                translated_text TEXT,
+                original_lang TEXT,
+                translated INTEGER NOT NULL DEFAULT 1,
+                query TEXT,
+                saved_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_translations_saved_at ON translations(saved_at)")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS imported_files (filename TEXT PRIMARY KEY)")
+        self._conn.commit()
+
+    def add_many(self, records: List[Dict], query: Optional[str] = None, saved_at: float = None) -> int:
+        """
+        Insert or update translation records (dicts with an 'id' key).
+
+        Returns:
+            int: Number of records written
+        """
+        saved_at = saved_at or time.time()
+        rows = [
+            (
+                str(record['id']),
+                record.get('original_text'),
+                record.get('translated_text'),
+                record.get('original_lang'),
+                1 if record.get('translated', True) else 0,
+                query,
+                saved_at
+            )
+            for record in records if record.get('id') is not None
+        ]
+        if not rows:
+            return 0
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO translations "
+                "(id, original_text, translated_text, original_lang, translated, query, saved_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            self._conn.commit()
+        return len(rows)
+
+    def _to_dict(self, row) -> Dict:
+        record = dict(zip(self.COLUMNS, row))
+        record['translated'] = bool(record['translated'])
+        return record
+
+    def get(self, tweet_id) -> Optional[Dict]:
+        """Look up the translation for a tweet ID"""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {', '.join(self.COLUMNS)} FROM translations WHERE id = ?", (str(tweet_id),)
+            ).fetchone()
+        return self._to_dict(row) if row else None
+
+    def list(self, offset: int = 0, limit: Optional[int] = 100) -> Tuple[List[Dict], int]:
+        """
+        List translations, newest first.
+
+        Returns:
+            tuple: (records for the requested page, total number of translations)
+        """
+        with self._lock:
+            total = self._conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+            rows = self._conn.execute(
+                f"SELECT {', '.join(self.COLUMNS)} FROM translations "
+                f"ORDER BY saved_at DESC, id LIMIT ? OFFSET ?",
+                (-1 if limit is None else limit, offset)
+            ).fetchall()
+        return [self._to_dict(row) for row in rows], total
+
+    def import_json_dir(self, directory: str) -> int:
+        """
+        One-time import of legacy translations_*.json files.
+
+        Each file is recorded once imported, so calling this again only picks up
+        files that were not seen before.
+
+        Returns:
+            int: Number of translation records imported
+        """
+        if not os.path.isdir(directory):
+            return 0
+
+        with self._lock:
+            imported = {row[0] for row in self._conn.execute("SELECT filename FROM imported_files")}
+
+        count = 0
+        for filename in sorted(os.listdir(directory)):
+            if not filename.endswith('.json') or filename in imported:
+                continue
+            filepath = os.path.join(directory, filename)
+            try:
+                with open(filepath, 'r', encoding='utf-8') as f:
+                    translation_data = json.load(f)
+                count += self.add_many(
+                    translation_data.get('translations', []),
+                    query=translation_data.get('query'),
+                    saved_at=os.path.getmtime(filepath)
+                )
+            except Exception as e:
+                self.logger.error(f"Error importing translations from {filepath}: {str(e)}")
+                continue
+            with self._lock:
+                self._conn.execute("INSERT OR IGNORE INTO imported_files (filename) VALUES (?)", (filename,))
+                self._conn.commit()
+
+        if count:
+            self.logger.info(f"Imported {count} translations from {directory}")
+        return count
@@ -0,0 +1,92 @@
+import threading
+from typing import Any, Dict, List, Optional
+
+class TrendsAggregator:
+    """
+    Merges per-country trend lists into a global view and tracks rank movement
+    between successive snapshots of each country.
+    """
+
+    def __init__(self):
+        self._snapshots: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def normalize(name: str) -> str:
+        return ' '.join(name.lower().split())
+
+    def movement(self, country: str, trends: List[Dict], loaded_at: Optional[float]) -> Dict[str, Optional[int]]:
+        """
+        Rank change per trend since the previous snapshot of a country.
+
+        A new snapshot starts whenever loaded_at changes (i.e. the trends were
+        refetched upstream). Positive values mean the trend moved up; None means
+        it was not in the previous snapshot.
+        """
+        ranks = {self.normalize(trend["name"]): trend["rank"] for trend in trends}
+        with self._lock:
+            snapshot = self._snapshots.get(country)
+            if snapshot is None:
+                snapshot = self._snapshots[country] = {"loaded_at": loaded_at, "ranks": ranks, "previous": {}}
+            elif snapshot["loaded_at"] != loaded_at:
+                snapshot["previous"] = snapshot["ranks"]
+                snapshot["ranks"] = ranks
+                snapshot["loaded_at"] = loaded_at
+            previous = snapshot["previous"]
+
+        return {
+            name: (previous[name] - rank) if name in previous else None
+            for name, rank in ranks.items()
+        }
+
+    def merge(self, country_trends: Dict[str, List[Dict]], movements: Dict[str, Dict[str, Optional[int]]] = None,
+              min_countries: int = 1) -> List[Dict]:
+        """
+        Combine trends across countries.
+
+        Args:
+            country_trends (dict): country -> formatted trends (as returned by fetch_trends)
+            movements (dict, optional): country -> movement() result
+            min_countries (int): Only keep trends present in at least this many countries
+
+        Returns:
+            list: One entry per distinct trend, most widespread first
+        """
+        movements = movements or {}
+        merged: Dict[str, Dict[str, Any]] = {}
+        for country, trends in country_trends.items():
+            country_movement = movements.get(country, {})
+            for trend in trends:
+                key = self.normalize(trend["name"])
+                entry = merged.setdefault(key, {
+                    "name": trend["name"],
+                    "countries": [],
+                    "tweet_volume": 0,
+                    "best_rank": trend["rank"],
+                    "rank_sum": 0
+                })
+                entry["countries"].append({
+                    "country": country,
+                    "rank": trend["rank"],
+                    "rank_change": country_movement.get(key)
+                })
+                entry["tweet_volume"] += trend.get("tweet_volume", 0) or 0
+                entry["best_rank"] = min(entry["best_rank"], trend["rank"])
+                entry["rank_sum"] += trend["rank"]
+
+        results = []
+        for entry in merged.values():
+            count = len(entry["countries"])
+            if count < min_countries:
+                continue
+            results.append({
+                "name": entry["name"],
+                "country_count": count,
+                "countries": entry["countries"],
+                "tweet_volume": entry["tweet_volume"],
+                "best_rank": entry["best_rank"],
+                "average_rank": round(entry["rank_sum"] / count, 1)
+            })
+
+        results.sort(key=lambda item: (-item["country_count"], item["average_rank"]))
+        return results
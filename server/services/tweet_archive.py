@@ -0,0 +1,271 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+class TweetArchive:
+    """
+    Embedded archive of scored tweets.
+
+    Tweets are stored once per tweet ID (re-fetches refresh engagement counters
+    and scores in place), linked to every query that returned them, and indexed
+    by query, creation time and sentiment so historical reads are filtered SQL
+    queries instead of re-parsing JSON dumps. Each row records the identity of
+    the model that scored it, so stored scores are only reused by that model.
+    """
+
+    TWEET_COLUMNS = [
+        'id', 'text', 'cleaned_text', 'timestamp', 'favorite_count', 'retweet_count',
+        'reply_count', 'sentiment', 'sentiment_score', 'negative_prob', 'neutral_prob',
+        'positive_prob', 'original_lang'
+    ]
+
+    def __init__(self, db_path="data/tweet_archive.db", model_identity=None):
+        self.logger = logging.getLogger(__name__)
+        self.db_path = db_path
+        self.model_identity = model_identity
+        self._lock = threading.Lock()
+
+        db_dir = os.path.dirname(db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS tweets (
+                id TEXT PRIMARY KEY,
+                text TEXT,
+                cleaned_text TEXT,
+                timestamp TEXT,
+                created_at REAL,
+                favorite_count INTEGER,
+                retweet_count INTEGER,
+                reply_count INTEGER,
+                sentiment TEXT,
+                sentiment_score REAL,
+                negative_prob REAL,
+                neutral_prob REAL,
+                positive_prob REAL,
+                original_lang TEXT,
+                model_identity TEXT,
+                first_seen REAL NOT NULL,
+                last_seen REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_tweets_created_at ON tweets(created_at);
+            CREATE INDEX IF NOT EXISTS idx_tweets_sentiment ON tweets(sentiment);
+
+            CREATE TABLE IF NOT EXISTS tweet_queries (
+                query TEXT NOT NULL,
+                tweet_id TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                PRIMARY KEY (query, tweet_id)
+            );
+            CREATE INDEX IF NOT EXISTS idx_tweet_queries_fetched ON tweet_queries(query, fetched_at);
+
+            CREATE TABLE IF NOT EXISTS searches (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                query TEXT NOT NULL,
+                searched_at REAL NOT NULL,
+                total_tweets INTEGER NOT NULL,
+                tweet_ids TEXT NOT NULL,
+                language_stats TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_searches_query ON searches(query, searched_at);
+            """
+        )
+        # Archives created before model identities were recorded
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(tweets)")}
+        if 'model_identity' not in columns:
+            self._conn.execute("ALTER TABLE tweets ADD COLUMN model_identity TEXT")
+        self._conn.commit()
+
+    @staticmethod
+    def _parse_created_at(timestamps: pd.Series) -> pd.Series:
+        """Twitter creation dates (e.g. 'Mon Apr 07 09:30:00 +0000 2025') to epoch seconds"""
+        parsed = pd.to_datetime(timestamps, format='%a %b %d %H:%M:%S %z %Y', errors='coerce', utc=True)
+        return (parsed - pd.Timestamp(0, tz='UTC')).dt.total_seconds()
+
+    def save_search(self, df: pd.DataFrame, query: str, language_stats: List[Dict] = None) -> int:
+        """
+        Archive the scored tweets of one search.
+
+        Args:
+            df (pd.DataFrame): Scored tweets
+            query (str): Search query that produced them
+            language_stats (list, optional): Language breakdown for the search metadata
+
+        Returns:
+            int: ID of the archived search
+        """
+        now = time.time()
+        frame = df.reindex(columns=self.TWEET_COLUMNS)
+        frame = frame.drop_duplicates(subset='id', keep='last')
+        frame['id'] = frame['id'].astype(str)
+        frame['created_at'] = self._parse_created_at(frame['timestamp'])
+        frame['model_identity'] = self.model_identity
+
+        columns = self.TWEET_COLUMNS + ['created_at', 'model_identity']
+        # Convert numpy/pandas scalars and NaN to plain Python values for sqlite
+        values = frame[columns].astype(object).where(frame[columns].notna(), None).values.tolist()
+        rows = [tuple(row) + (now, now) for row in values]
+
+        placeholders = ', '.join('?' * (len(columns) + 2))
+        updates = ', '.join(
+            f"{column} = excluded.{column}" for column in columns if column != 'id'
+        )
+        tweet_ids = frame['id'].tolist()
+
+        with self._lock:
+            self._conn.executemany(
+                f"INSERT INTO tweets ({', '.join(columns)}, first_seen, last_seen) VALUES ({placeholders}) "
+                f"ON CONFLICT(id) DO UPDATE SET {updates}, last_seen = excluded.last_seen",
+                rows
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO tweet_queries (query, tweet_id, fetched_at) VALUES (?, ?, ?)",
+                [(query, tweet_id, now) for tweet_id in tweet_ids]
+            )
+            cursor = self._conn.execute(
+                "INSERT INTO searches (query, searched_at, total_tweets, tweet_ids, language_stats) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (query, now, len(tweet_ids), json.dumps(tweet_ids), json.dumps(language_stats or []))
+            )
+            self._conn.commit()
+            search_id = cursor.lastrowid
+
+        self.logger.debug(f"Archived {len(tweet_ids)} tweets for '{query}' as search {search_id}")
+        return search_id
+
+    def query_tweets(self, query: Optional[str] = None, since: Optional[float] = None,
+                     until: Optional[float] = None, sentiment: Optional[str] = None,
+                     limit: Optional[int] = 1000, offset: int = 0) -> pd.DataFrame:
+        """
+        Read archived tweets filtered by query, creation time range and sentiment.
+
+        Args:
+            query (str, optional): Only tweets returned by this search query
+            since (float, optional): Earliest creation time (epoch seconds)
+            until (float, optional): Latest creation time (epoch seconds)
+            sentiment (str, optional): 'positive', 'neutral' or 'negative'
+            limit (int, optional): Maximum rows, newest first
+            offset (int): Rows to skip
+
+        Returns:
+            pd.DataFrame: Matching tweets
+        """
+        sql = "SELECT t.* FROM tweets t"
+        clauses, params = [], []
+        if query is not None:
+            sql += " JOIN tweet_queries q ON q.tweet_id = t.id"
+            clauses.append("q.query = ?")
+            params.append(query)
+        if since is not None:
+            clauses.append("t.created_at >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("t.created_at <= ?")
+            params.append(until)
+        if sentiment is not None:
+            clauses.append("t.sentiment = ?")
+            params.append(sentiment)
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY t.created_at DESC LIMIT ? OFFSET ?"
+        params.extend([-1 if limit is None else limit, offset])
+
+        with self._lock:
+            return pd.read_sql_query(sql, self._conn, params=params)
+
+    def get_tweets(self, tweet_ids: List[str]) -> pd.DataFrame:
+        """Read archived tweets by ID"""
+        frames = []
+        with self._lock:
+            for start in range(0, len(tweet_ids), 500):
+                chunk = [str(tweet_id) for tweet_id in tweet_ids[start:start + 500]]
+                placeholders = ','.join('?' * len(chunk))
+                frames.append(pd.read_sql_query(
+                    f"SELECT * FROM tweets WHERE id IN ({placeholders})", self._conn, params=chunk
+                ))
+        if not frames:
+            return pd.DataFrame(columns=self.TWEET_COLUMNS + ['created_at', 'model_identity',
+                                                              'first_seen', 'last_seen'])
+        return pd.concat(frames, ignore_index=True)
+
+    def get_search(self, search_id: Optional[int] = None) -> Optional[Dict]:
+        """
+        Metadata and tweets of one archived search (the most recent if no ID is given).
+        """
+        with self._lock:
+            if search_id is None:
+                row = self._conn.execute(
+                    "SELECT id, query, searched_at, total_tweets, tweet_ids, language_stats "
+                    "FROM searches ORDER BY id DESC LIMIT 1"
+                ).fetchone()
+            else:
+                row = self._conn.execute(
+                    "SELECT id, query, searched_at, total_tweets, tweet_ids, language_stats "
+                    "FROM searches WHERE id = ?", (search_id,)
+                ).fetchone()
+        if row is None:
+            return None
+
+        search_id, query, searched_at, total, tweet_ids, language_stats = row
+        tweets = self.get_tweets(json.loads(tweet_ids))
+        tweets = tweets[[column for column in self.TWEET_COLUMNS if column in tweets.columns]]
+        return {
+            "metadata": {
+                "search_id": search_id,
+                "search_query": query,
+                "timestamp": searched_at,
+                "total_tweets": total,
+                "language_stats": json.loads(language_stats or '[]')
+            },
+            "tweets": tweets.astype(object).where(tweets.notna(), None).to_dict(orient='records')
+        }
+
+    # Columns computed by cleaning, translation and scoring, which can be reused for known tweets
+    DERIVED_COLUMNS = [
+        'cleaned_text', 'original_lang', 'sentiment', 'sentiment_score',
+        'negative_prob', 'neutral_prob', 'positive_prob'
+    ]
+
+    def split_known(self, df: pd.DataFrame):
+        """
+        Split freshly fetched tweets into already-archived and new ones.
+
+        Archived tweets keep the freshly fetched fields (text, engagement counters,
+        user info) and get their cleaned text, language and sentiment from the
+        archive, so only new tweets need cleaning and scoring. Tweets scored by a
+        different model (or before identities were recorded) count as new.
+
+        Returns:
+            tuple: (known tweets with derived columns filled in, new tweets as fetched)
+        """
+        if df.empty:
+            return df.iloc[0:0], df
+
+        ids = df['id'].astype(str)
+        archived = self.get_tweets(ids.unique().tolist())
+        archived = archived[
+            archived['sentiment_score'].notna()
+            & archived['cleaned_text'].notna()
+            & (archived['model_identity'] == self.model_identity)
+        ]
+        if archived.empty:
+            return df.iloc[0:0], df
+
+        archived = archived.set_index('id')[self.DERIVED_COLUMNS]
+        is_known = ids.isin(archived.index)
+
+        known = df[is_known].drop(columns=[c for c in self.DERIVED_COLUMNS if c in df.columns])
+        known = known.assign(_archive_id=ids[is_known])
+        known = known.merge(archived, left_on='_archive_id', right_index=True, how='left')
+        return known.drop(columns=['_archive_id']), df[~is_known]
@@ -1,23 +1,146 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterator, List
 from config.config import TwitterConfig
+from services.rate_limiter import get_shared_rate_limiter
+from services.watermark_store import tweet_id_value
 import logging
+import queue
+import threading
 import time
 
+# Responses retried by TwitterService._get, each retry taking its own rate-limit token
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Sessions are shared by every TwitterService using the same credentials
+_sessions: Dict[tuple, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+def get_shared_session(config: TwitterConfig) -> requests.Session:
+    """
+    Return the process-wide keep-alive session for the given API credentials.
+
+    The session carries the RapidAPI headers, a per-host connection pool and
+    retries with exponential backoff for failed connections only. Those never
+    reach the API; 429 and 5xx responses are retried by TwitterService._get so
+    every attempt goes through the shared rate limiter.
+    """
+    key = (config.API_KEY, config.API_HOST)
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None:
+            retry = Retry(
+                total=config.MAX_RETRIES,
+                connect=config.MAX_RETRIES,
+                read=0,
+                status=0,
+                backoff_factor=config.BACKOFF_FACTOR,
+                allowed_methods=frozenset(["GET"]),
+                raise_on_status=False
+            )
+            adapter = HTTPAdapter(
+                pool_connections=config.POOL_CONNECTIONS,
+                pool_maxsize=config.POOL_MAXSIZE,
+                max_retries=retry
+            )
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update({
+                "x-rapidapi-key": config.API_KEY,
+                "x-rapidapi-host": config.API_HOST
+            })
+            _sessions[key] = session
+        return session
+
 class TwitterService:
     def __init__(self, config: TwitterConfig):
         self.config = config
         logging.basicConfig(level=logging.DEBUG)
         self.logger = logging.getLogger(__name__)
+        self.session = get_shared_session(config)
+        self.rate_limiter = get_shared_rate_limiter(config)
+        self.timeout = (config.CONNECT_TIMEOUT, config.READ_TIMEOUT)
 
-    def fetch_tweets(self, query: str) -> pd.DataFrame:
-        headers = {
-            "x-rapidapi-key": self.config.API_KEY,
-            "x-rapidapi-host": self.config.API_HOST
-        }
-        
+    def _get(self, url: str, params: Dict[str, Any]) -> requests.Response:
+        """
+        Issue a GET through the shared session once the shared rate budget allows it.
+
+        429 and 5xx responses are retried up to config.MAX_RETRIES times with
+        exponential backoff (or the server's Retry-After); every attempt takes
+        its own token, so retries stay within the shared budget.
+        """
+        for attempt in range(self.config.MAX_RETRIES + 1):
+            waited = self.rate_limiter.acquire()
+            if waited:
+                self.logger.debug(f"Rate limiter delayed request by {waited:.2f}s")
+            response = self.session.get(url, params=params, timeout=self.timeout)
+            if response.status_code not in RETRY_STATUSES or attempt == self.config.MAX_RETRIES:
+                return response
+
+            delay = self.config.BACKOFF_FACTOR * (2 ** attempt)
+            retry_after = response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                delay = max(delay, float(retry_after))
+            self.logger.debug(f"Upstream returned {response.status_code}, retrying in {delay:.1f}s")
+            time.sleep(delay)
+        return response
+
+    def rate_limit_status(self) -> Dict[str, float]:
+        """Current shared upstream request budget"""
+        return self.rate_limiter.budget()
+
+    def fetch_tweets(self, query: str, since_id: int = None) -> pd.DataFrame:
         all_tweets_data = []
+        for page_tweets in self.iter_tweet_pages(query, since_id=since_id):
+            all_tweets_data.extend(page_tweets)
+            self.logger.debug(f"Total tweets collected so far: {len(all_tweets_data)}")
+        
+        if not all_tweets_data:
+            if since_id is not None:
+                # Nothing newer than the watermark is a normal outcome when polling
+                return pd.DataFrame(columns=list(self._process_tweet_data({}).keys()))
+            raise Exception("No tweets found in the response")
+        
+        df = pd.DataFrame(all_tweets_data)
+        self.logger.debug(f"Final DataFrame shape: {df.shape}")
+        return df
+
+    def _split_at_watermark(self, tweets: List[Dict], since_id: int = None):
+        """
+        Keep only tweets newer than since_id.
+
+        Returns:
+            tuple: (newer tweets, whether the page reached the watermark)
+        """
+        if since_id is None:
+            return tweets, False
+        newer = []
+        reached = False
+        for tweet in tweets:
+            value = tweet_id_value(tweet["id"])
+            if value is not None and value <= since_id:
+                reached = True
+            else:
+                newer.append(tweet)
+        return newer, reached
+
+    def iter_tweet_pages(self, query: str, max_pages: int = None, since_id: int = None) -> Iterator[List[Dict]]:
+        """
+        Fetch search results page by page, yielding each page as soon as it arrives.
+
+        Args:
+            query (str): Search query
+            max_pages (int, optional): Page limit, defaults to config.MAX_PAGES
+            since_id (int, optional): Watermark; only tweets newer than this ID are
+                        returned and paging stops at the first page reaching it
+
+        Yields:
+            List[Dict]: Processed tweet dicts for one page
+        """
+        max_pages = max_pages or self.config.MAX_PAGES
         params = {**self.config.DEFAULT_SEARCH_PARAMS, "query": query}
         
         # Debug print initial parameters
@@ -25,11 +148,7 @@ class TwitterService:
         
         # Initial search
         try:
-            response = requests.get(
-                self.config.SEARCH_URL,
-                headers=headers,
-                params=params
-            )
+            response = self._get(self.config.SEARCH_URL, params)
             
             if response.status_code != 200:
                 raise Exception(f"API request failed: {response.status_code} - {response.text}")
@@ -38,75 +157,126 @@ class TwitterService:
             # Debug print response data structure
             self.logger.debug(f"Initial response keys: {data.keys()}")
             self.logger.debug(f"Number of initial results: {len(data.get('results', []))}")
+        except Exception as e:
+            self.logger.error(f"Error in initial request: {str(e)}")
+            raise e
             
-            initial_tweets = data.get("results", [])
-            all_tweets_data.extend([self._process_tweet_data(tweet) for tweet in initial_tweets])
+        initial_tweets = data.get("results", [])
+        page_tweets, reached = self._split_at_watermark(
+            [self._process_tweet_data(tweet) for tweet in initial_tweets], since_id
+        )
+        yield page_tweets
+        if reached:
+            self.logger.debug("Reached watermark on the first page, stopping")
+            return
+        
+        # Get continuation token
+        continuation_token = data.get("continuation_token")
+        self.logger.debug(f"Continuation token received: {continuation_token is not None}")
+        
+        page = 1
+        
+        while continuation_token and page < max_pages:
+            self.logger.debug(f"Fetching page {page + 1}")
             
-            # Get continuation token
-            continuation_token = data.get("continuation_token")
-            self.logger.debug(f"Continuation token received: {continuation_token is not None}")
+            continuation_params = {
+                **params,
+                "continuation_token": continuation_token
+            }
             
-            page = 1
-            max_pages = 8  # Limit pages for testing
+            # Debug print continuation parameters
+            self.logger.debug(f"Continuation parameters: {continuation_params}")
             
-            while continuation_token and page < max_pages:
-                self.logger.debug(f"Fetching page {page + 1}")
-                time.sleep(1)  # Rate limiting
+            try:
+                continuation_url = f"{self.config.SEARCH_URL}/continuation"
+                self.logger.debug(f"Continuation URL: {continuation_url}")
                 
-                continuation_params = {
-                    **params,
-                    "continuation_token": continuation_token
-                }
+                response = self._get(continuation_url, continuation_params)
                 
-                # Debug print continuation parameters
-                self.logger.debug(f"Continuation parameters: {continuation_params}")
+                if response.status_code != 200:
+                    self.logger.error(f"Continuation request failed: {response.status_code}")
+                    break
                 
+                cont_data = response.json()
+                # Debug print continuation response
+                self.logger.debug(f"Continuation response keys: {cont_data.keys()}")
+                self.logger.debug(f"Number of continuation results: {len(cont_data.get('results', []))}")
+            except Exception as e:
+                self.logger.error(f"Error in continuation request: {str(e)}")
+                break
+                
+            new_tweets = cont_data.get("results", [])
+            if not new_tweets:
+                self.logger.debug("No new tweets in continuation response")
+                break
+            
+            page_tweets, reached = self._split_at_watermark(
+                [self._process_tweet_data(tweet) for tweet in new_tweets], since_id
+            )
+            yield page_tweets
+            if reached:
+                self.logger.debug(f"Reached watermark on page {page + 1}, stopping")
+                break
+            
+            continuation_token = cont_data.get("continuation_token")
+            self.logger.debug(f"New continuation token received: {continuation_token is not None}")
+            
+            page += 1
+
+    def iter_tweet_frames(self, query: str, max_pages: int = None, prefetch: int = 1,
+                          since_id: int = None) -> Iterator[pd.DataFrame]:
+        """
+        Yield one DataFrame per non-empty page while the next pages are fetched in the background.
+
+        Pages are fetched on a helper thread into a bounded queue, so cleaning and
+        scoring page N overlaps with the network round trip for page N + 1.
+
+        Args:
+            query (str): Search query
+            max_pages (int, optional): Page limit, defaults to config.MAX_PAGES
+            prefetch (int): Number of pages fetched ahead of the consumer
+            since_id (int, optional): Watermark, see iter_tweet_pages
+
+        Yields:
+            pd.DataFrame: Tweets of one page
+        """
+        pages = queue.Queue(maxsize=max(1, prefetch))
+        stop = threading.Event()
+        done = object()
+
+        def put(item):
+            # Give up if the consumer stopped iterating
+            while not stop.is_set():
                 try:
-                    continuation_url = f"{self.config.SEARCH_URL}/continuation"
-                    self.logger.debug(f"Continuation URL: {continuation_url}")
-                    
-                    response = requests.get(
-                        continuation_url,
-                        headers=headers,
-                        params=continuation_params
-                    )
-                    
-                    if response.status_code != 200:
-                        self.logger.error(f"Continuation request failed: {response.status_code}")
-                        break
-                    
-                    cont_data = response.json()
-                    # Debug print continuation response
-                    self.logger.debug(f"Continuation response keys: {cont_data.keys()}")
-                    self.logger.debug(f"Number of continuation results: {len(cont_data.get('results', []))}")
-                    
-                    new_tweets = cont_data.get("results", [])
-                    if not new_tweets:
-                        self.logger.debug("No new tweets in continuation response")
-                        break
-                    
-                    all_tweets_data.extend([self._process_tweet_data(tweet) for tweet in new_tweets])
-                    self.logger.debug(f"Total tweets collected so far: {len(all_tweets_data)}")
-                    
-                    continuation_token = cont_data.get("continuation_token")
-                    self.logger.debug(f"New continuation token received: {continuation_token is not None}")
-                    
-                    page += 1
-                    
-                except Exception as e:
-                    self.logger.error(f"Error in continuation request: {str(e)}")
-                    break
-                    
-        except Exception as e:
-            self.logger.error(f"Error in initial request: {str(e)}")
-            raise e
-        
-        if not all_tweets_data:
-            raise Exception("No tweets found in the response")
-        
-        df = pd.DataFrame(all_tweets_data)
-        self.logger.debug(f"Final DataFrame shape: {df.shape}")
-        return df
+                    pages.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def producer():
+            try:
+                for page_tweets in self.iter_tweet_pages(query, max_pages, since_id):
+                    if not put(page_tweets):
+                        return
+            except Exception as e:
+                put(e)
+                return
+            put(done)
+
+        thread = threading.Thread(target=producer, name="tweet-prefetch", daemon=True)
+        thread.start()
+        try:
+            while True:
+                item = pages.get()
+                if item is done:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                if item:
+                    yield pd.DataFrame(item)
+        finally:
+            stop.set()
 
     def _process_tweet_data(self, tweet: Dict) -> Dict:
         """Helper method to process tweet data remains unchanged"""
@@ -137,20 +307,11 @@ class TwitterService:
         """
         self.logger.debug(f"Fetching trends for WOEID: {woeid}")
         
-        headers = {
-            "x-rapidapi-key": self.config.API_KEY,
-            "x-rapidapi-host": self.config.API_HOST
-        }
-        
         querystring = {"woeid": woeid}
         
         try:
             self.logger.debug(f"Making request to: {self.config.TRENDS_URL}")
-            response = requests.get(
-                self.config.TRENDS_URL,
-                headers=headers,
-                params=querystring
-            )
+            response = self._get(self.config.TRENDS_URL, querystring)
             
             self.logger.debug(f"Response status code: {response.status_code}")
             
@@ -160,7 +321,6 @@ class TwitterService:
                 raise Exception(error_msg)
             
             response_data = response.json()
-            self.logger.debug(f"Raw API response: {response_data}")
             
             # Extract trends from the correct structure
             # response_data is a list with one object containing trends
@@ -0,0 +1,99 @@
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+def tweet_id_value(tweet_id) -> Optional[int]:
+    """Numeric value of a tweet ID (IDs are time-ordered snowflakes), or None if not numeric"""
+    try:
+        return int(tweet_id)
+    except (TypeError, ValueError):
+        return None
+
+class WatermarkStore:
+    """
+    Per-query record of the newest tweet seen, used to stop paging once a
+    fetch reaches tweets that were already collected.
+
+    Watermarks can be kept in separate scopes (e.g. "monitor") so one consumer
+    advancing its watermark does not hide tweets from another.
+    """
+
+    def __init__(self, db_path="data/watermarks.db"):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+
+        db_dir = os.path.dirname(db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS watermarks (
+                query TEXT PRIMARY KEY,
+                newest_id TEXT NOT NULL,
+                newest_timestamp TEXT,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        return ' '.join(query.lower().split())
+
+    def _key(self, query: str, scope: Optional[str] = None) -> str:
+        key = self.normalize_query(query)
+        return f"{scope}\0{key}" if scope else key
+
+    def get(self, query: str, scope: Optional[str] = None) -> Optional[Dict]:
+        """Watermark for a query, or None if the query has not been fetched before in this scope"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT newest_id, newest_timestamp, updated_at FROM watermarks WHERE query = ?",
+                (self._key(query, scope),)
+            ).fetchone()
+        if row is None:
+            return None
+        return {"newest_id": row[0], "newest_timestamp": row[1], "updated_at": row[2]}
+
+    def get_since_id(self, query: str, scope: Optional[str] = None) -> Optional[int]:
+        watermark = self.get(query, scope)
+        return tweet_id_value(watermark["newest_id"]) if watermark else None
+
+    def update(self, query: str, df, scope: Optional[str] = None) -> Optional[Dict]:
+        """
+        Advance the query's watermark to the newest tweet in df (never moves backwards).
+
+        Returns:
+            dict: The watermark after the update, or None if df had no numeric IDs
+        """
+        if df is None or df.empty:
+            return self.get(query, scope)
+
+        # Compare Python ints: a float Series would round 64-bit snowflake IDs
+        candidates = [
+            (value, index)
+            for index, value in ((index, tweet_id_value(tweet_id)) for index, tweet_id in df['id'].items())
+            if value is not None
+        ]
+        if not candidates:
+            return self.get(query, scope)
+        newest_id, newest_index = max(candidates, key=lambda candidate: candidate[0])
+        newest_timestamp = df.at[newest_index, 'timestamp'] if 'timestamp' in df.columns else None
+
+        key = self._key(query, scope)
+        with self._lock:
+            row = self._conn.execute("SELECT newest_id FROM watermarks WHERE query = ?", (key,)).fetchone()
+            current = tweet_id_value(row[0]) if row else None
+            if current is None or newest_id > current:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO watermarks (query, newest_id, newest_timestamp, updated_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (key, str(newest_id), newest_timestamp, time.time())
+                )
+                self._conn.commit()
+        return self.get(query, scope)